@@ -22,6 +22,7 @@ from utils.app_styles import (
     get_page_background_html,
 )
 from config import APP_CONFIG, PAGE_BACKGROUND_IMAGES
+from models.database import PoolSaturee
 
 from views.auth_view import afficher_page_connexion
 from views.commande_view import afficher_page_commande
@@ -172,7 +173,16 @@ def main() -> None:
     if page_bg_html:
         st.markdown(page_bg_html, unsafe_allow_html=True)
 
-    _route_authenticated_page()
+    try:
+        _route_authenticated_page()
+    except PoolSaturee:
+        # Toutes les connexions sont occupées : l'action n'a pas été effectuée
+        logger.warning("Pool de connexions saturé")
+        st.warning("⏳ Serveur momentanément saturé : votre action n'a pas été enregistrée. Réessayez dans quelques secondes.")
+    except Exception:
+        # Frontière unique : les erreurs non SQL remontées par les modèles
+        logger.exception("Erreur inattendue lors de l'affichage de la page")
+        st.error("❌ Une erreur inattendue est survenue. Rechargez la page.")
 
     render_bottom_nav(
         {
@@ -151,7 +151,7 @@ class AuthController:
             if role_utilisateur != 'SUPER_ADMIN' and salon_id:
                 try:
                     salon_model = SalonModel(self.db_connection)
-                    salon_info = salon_model.obtenir_salon_by_id(salon_id)
+                    salon_info = salon_model.obtenir_salon_sans_admin(salon_id)
                     # Si le salon existe et est inactif (False)
                     if salon_info and salon_info.get('actif') is False:
                         return False, None, "Ton salon a été désactivé. Contacte An's Learning  698192507."
@@ -56,7 +56,7 @@ class PDFController:
         try:
             from models.salon_model import SalonModel
             salon_model = SalonModel(self.db_connection)
-            salon = salon_model.obtenir_salon_by_id(str(salon_id))
+            salon = salon_model.obtenir_salon_sans_admin(str(salon_id))
             if not salon:
                 return None
 
@@ -176,10 +176,10 @@ class PDFController:
                 try:
                     from models.database import AppLogoModel
                     logo_model = AppLogoModel(self.db_connection)
-                    logo_data = logo_model.recuperer_logo(salon_id)
+                    logo_bytes = logo_model.recuperer_logo_bytes(salon_id)
                     
-                    if logo_data and logo_data.get('logo_data'):
-                        logo_filigrane_data = logo_data['logo_data']
+                    if logo_bytes:
+                        logo_filigrane_data = logo_bytes
                         print(f"✅ Logo filigrane chargé depuis la base de données (Salon ID: {salon_id})")
                 except Exception as e:
                     print(f"Erreur récupération logo filigrane depuis BDD: {e}")
@@ -293,15 +293,13 @@ class PDFController:
                 try:
                     from models.database import AppLogoModel
                     logo_model = AppLogoModel(self.db_connection)
-                    logo_data = logo_model.recuperer_logo(salon_id)
+                    logo_bytes = logo_model.recuperer_logo_bytes(salon_id)
                     
-                    if logo_data and logo_data.get('logo_data'):
-                        # Créer une image depuis les bytes
-                        logo_bytes = logo_data['logo_data']
+                    if logo_bytes:
                         # Créer un ImageReader puis une Image ReportLab
                         logo_reader = ImageReader(io.BytesIO(logo_bytes))
                         logo_image = Image(logo_reader, width=4*cm, height=4*cm)
-                        print(f"✅ Logo PDF chargé depuis la base de données (Salon ID: {salon_id}): {logo_data.get('logo_name', 'logo')}")
+                        print(f"✅ Logo PDF chargé depuis la base de données (Salon ID: {salon_id})")
                 except Exception as e:
                     print(f"❌ Erreur récupération logo depuis BDD: {e}")
                     import traceback
@@ -795,9 +793,9 @@ class PDFController:
                 try:
                     from models.database import AppLogoModel
                     logo_model = AppLogoModel(self.db_connection)
-                    logo_data = logo_model.recuperer_logo(salon_id)
-                    if logo_data and logo_data.get('logo_data'):
-                        logo_filigrane_data = logo_data['logo_data']
+                    logo_bytes = logo_model.recuperer_logo_bytes(salon_id)
+                    if logo_bytes:
+                        logo_filigrane_data = logo_bytes
                         print(f"✅ Logo filigrane (livraison) chargé depuis app_logo (Salon ID: {salon_id})")
                 except Exception as e:
                     print(f"❌ Erreur récupération logo livraison depuis app_logo: {e}")
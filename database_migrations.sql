@@ -0,0 +1,76 @@
+-- ============================================================================
+-- Migrations PostgreSQL pour les bases déjà en production
+-- (les nouvelles installations les reçoivent via database_schema.sql)
+-- À exécuter hors transaction (psql en autocommit) : CONCURRENTLY évite
+-- de bloquer les écritures pendant la construction des index
+-- ============================================================================
+
+-- --------------------------------------------------------------------------
+-- Index des statistiques par salon (SalonModel.lister_tous_salons)
+-- --------------------------------------------------------------------------
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_couturiers_salon_role ON couturiers(salon_id, role);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_clients_salon ON clients(salon_id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_commandes_salon_prix ON commandes(salon_id) INCLUDE (prix_total);
+
+-- MySQL (pas d'INCLUDE ni de CONCURRENTLY) :
+-- CREATE INDEX idx_couturiers_salon_role ON couturiers(salon_id, role);
+-- CREATE INDEX idx_clients_salon ON clients(salon_id);
+-- CREATE INDEX idx_commandes_salon_prix ON commandes(salon_id, prix_total);
+
+-- --------------------------------------------------------------------------
+-- Indicateur de compression des logos (AppLogoModel.recuperer_logo / recuperer_logo_bytes)
+-- --------------------------------------------------------------------------
+ALTER TABLE app_logo ADD COLUMN IF NOT EXISTS compressed BOOLEAN NOT NULL DEFAULT FALSE;
+
+-- MySQL (pas de IF NOT EXISTS sur ADD COLUMN) :
+-- ALTER TABLE app_logo ADD COLUMN compressed BOOLEAN NOT NULL DEFAULT FALSE;
+
+-- --------------------------------------------------------------------------
+-- Fonction : créer un salon et son admin en un seul appel
+-- (équivalent PostgreSQL de la procédure MySQL creer_nouveau_salon ;
+--  nécessite generer_prochain_salon_id, cf. database_schema.sql)
+-- --------------------------------------------------------------------------
+CREATE OR REPLACE FUNCTION creer_nouveau_salon_pg(
+    p_nom            VARCHAR,
+    p_quartier       VARCHAR,
+    p_responsable    VARCHAR,
+    p_telephone      VARCHAR,
+    p_email          VARCHAR,
+    p_code_admin     VARCHAR,
+    p_password_admin VARCHAR,
+    p_nom_admin      VARCHAR,
+    p_prenom_admin   VARCHAR,
+    p_smtp_host      VARCHAR DEFAULT NULL,
+    p_smtp_port      INTEGER DEFAULT NULL,
+    p_smtp_user      VARCHAR DEFAULT NULL,
+    p_smtp_password  VARCHAR DEFAULT NULL,
+    p_smtp_from      VARCHAR DEFAULT NULL,
+    p_smtp_use_tls   BOOLEAN DEFAULT NULL,
+    p_smtp_use_ssl   BOOLEAN DEFAULT NULL
+)
+RETURNS TABLE (nouveau_salon_id VARCHAR, nouveau_admin_id INTEGER) AS $$
+DECLARE
+    v_salon_id VARCHAR(50);
+    v_admin_id INTEGER;
+BEGIN
+    v_salon_id := COALESCE(generer_prochain_salon_id(), 'Jaind_000');
+
+    INSERT INTO salons (
+        salon_id, nom, quartier, responsable, telephone, email,
+        code_admin, smtp_host, smtp_port, smtp_user, smtp_password,
+        smtp_from, smtp_use_tls, smtp_use_ssl
+    )
+    VALUES (
+        v_salon_id, p_nom, p_quartier, p_responsable, p_telephone, p_email,
+        p_code_admin, COALESCE(p_smtp_host, 'smtp.gmail.com'), COALESCE(p_smtp_port, 587),
+        p_smtp_user, p_smtp_password, COALESCE(p_smtp_from, p_smtp_user),
+        COALESCE(p_smtp_use_tls, TRUE), COALESCE(p_smtp_use_ssl, FALSE)
+    );
+
+    INSERT INTO couturiers (code_couturier, password, nom, prenom, role, salon_id, email, telephone)
+    VALUES (p_code_admin, p_password_admin, p_nom_admin, p_prenom_admin, 'admin', v_salon_id, p_email, p_telephone)
+    RETURNING id INTO v_admin_id;
+
+    RETURN QUERY SELECT v_salon_id, v_admin_id;
+END;
+$$ LANGUAGE plpgsql;
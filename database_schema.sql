@@ -56,6 +56,8 @@ CREATE INDEX IF NOT EXISTS idx_couturiers_code ON couturiers(code_couturier);
 CREATE INDEX IF NOT EXISTS idx_couturiers_email ON couturiers(email);
 CREATE INDEX IF NOT EXISTS idx_couturiers_salon ON couturiers(salon_id);
 CREATE INDEX IF NOT EXISTS idx_couturiers_role ON couturiers(role);
+CREATE INDEX IF NOT EXISTS idx_couturiers_salon_id ON couturiers(salon_id, id);
+CREATE INDEX IF NOT EXISTS idx_couturiers_salon_role ON couturiers(salon_id, role);
 
 -- FK vers salons (optionnelle car super_admin peut être NULL)
 ALTER TABLE couturiers
@@ -131,6 +133,8 @@ CREATE TABLE IF NOT EXISTS commandes (
 CREATE INDEX IF NOT EXISTS idx_commandes_client_id ON commandes(client_id);
 CREATE INDEX IF NOT EXISTS idx_commandes_couturier_id ON commandes(couturier_id);
 CREATE INDEX IF NOT EXISTS idx_commandes_salon ON commandes(salon_id);
+-- Couvrant pour les statistiques par salon (COUNT / SUM(prix_total))
+CREATE INDEX IF NOT EXISTS idx_commandes_salon_prix ON commandes(salon_id) INCLUDE (prix_total);
 CREATE INDEX IF NOT EXISTS idx_commandes_statut ON commandes(statut);
 CREATE INDEX IF NOT EXISTS idx_commandes_date_creation ON commandes(date_creation);
 CREATE INDEX IF NOT EXISTS idx_commandes_date_livraison ON commandes(date_livraison);
@@ -197,6 +201,9 @@ CREATE INDEX IF NOT EXISTS idx_charges_type ON charges(type);
 CREATE INDEX IF NOT EXISTS idx_charges_date ON charges(date_charge);
 CREATE INDEX IF NOT EXISTS idx_charges_commande ON charges(commande_id);
 CREATE INDEX IF NOT EXISTS idx_charges_employe ON charges(employe_id);
+-- Liste paginée : ORDER BY date_charge DESC, id DESC LIMIT sans tri (index-only scan)
+CREATE INDEX IF NOT EXISTS idx_charges_cout_date ON charges(couturier_id, date_charge DESC, id DESC)
+    INCLUDE (type, categorie, description, montant);
 
 -- --------------------------------------------------------------------------
 -- TABLE : charge_documents (fichiers liés aux charges)
@@ -234,6 +241,7 @@ CREATE TABLE IF NOT EXISTS app_logo (
     uploaded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     uploaded_by INTEGER NULL,
     description VARCHAR(255),
+    compressed  BOOLEAN NOT NULL DEFAULT FALSE,
     FOREIGN KEY (salon_id) REFERENCES salons(salon_id) ON DELETE CASCADE ON UPDATE CASCADE,
     FOREIGN KEY (uploaded_by) REFERENCES couturiers(id) ON DELETE SET NULL ON UPDATE CASCADE
 );
@@ -283,6 +291,55 @@ BEGIN
 END;
 $$ LANGUAGE plpgsql;
 
+-- --------------------------------------------------------------------------
+-- Fonction : créer un salon et son admin en un seul appel
+-- (équivalent PostgreSQL de la procédure MySQL creer_nouveau_salon)
+-- --------------------------------------------------------------------------
+CREATE OR REPLACE FUNCTION creer_nouveau_salon_pg(
+    p_nom            VARCHAR,
+    p_quartier       VARCHAR,
+    p_responsable    VARCHAR,
+    p_telephone      VARCHAR,
+    p_email          VARCHAR,
+    p_code_admin     VARCHAR,
+    p_password_admin VARCHAR,
+    p_nom_admin      VARCHAR,
+    p_prenom_admin   VARCHAR,
+    p_smtp_host      VARCHAR DEFAULT NULL,
+    p_smtp_port      INTEGER DEFAULT NULL,
+    p_smtp_user      VARCHAR DEFAULT NULL,
+    p_smtp_password  VARCHAR DEFAULT NULL,
+    p_smtp_from      VARCHAR DEFAULT NULL,
+    p_smtp_use_tls   BOOLEAN DEFAULT NULL,
+    p_smtp_use_ssl   BOOLEAN DEFAULT NULL
+)
+RETURNS TABLE (nouveau_salon_id VARCHAR, nouveau_admin_id INTEGER) AS $$
+DECLARE
+    v_salon_id VARCHAR(50);
+    v_admin_id INTEGER;
+BEGIN
+    v_salon_id := COALESCE(generer_prochain_salon_id(), 'Jaind_000');
+
+    INSERT INTO salons (
+        salon_id, nom, quartier, responsable, telephone, email,
+        code_admin, smtp_host, smtp_port, smtp_user, smtp_password,
+        smtp_from, smtp_use_tls, smtp_use_ssl
+    )
+    VALUES (
+        v_salon_id, p_nom, p_quartier, p_responsable, p_telephone, p_email,
+        p_code_admin, COALESCE(p_smtp_host, 'smtp.gmail.com'), COALESCE(p_smtp_port, 587),
+        p_smtp_user, p_smtp_password, COALESCE(p_smtp_from, p_smtp_user),
+        COALESCE(p_smtp_use_tls, TRUE), COALESCE(p_smtp_use_ssl, FALSE)
+    );
+
+    INSERT INTO couturiers (code_couturier, password, nom, prenom, role, salon_id, email, telephone)
+    VALUES (p_code_admin, p_password_admin, p_nom_admin, p_prenom_admin, 'admin', v_salon_id, p_email, p_telephone)
+    RETURNING id INTO v_admin_id;
+
+    RETURN QUERY SELECT v_salon_id, v_admin_id;
+END;
+$$ LANGUAGE plpgsql;
+
 -- --------------------------------------------------------------------------
 -- Vérifications / infos
 -- --------------------------------------------------------------------------
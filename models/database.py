@@ -1,8 +1,16 @@
 """
 Modèle de gestion de la base de données (Model dans MVC)
 """
+import functools
+import logging
+import re
+import threading
+import weakref
+import zlib
+from contextlib import contextmanager
+from time import monotonic
 from typing import Optional, Dict, List, Tuple
-from datetime import datetime
+from datetime import datetime, time
 
 # Support multi-SGBD: PostgreSQL (legacy) et MySQL (XAMPP)
 try:
@@ -15,9 +23,36 @@ except Exception:
 try:
     import psycopg2  # type: ignore
     from psycopg2 import Error as PGError  # type: ignore
+    from psycopg2 import pool as pg_pool  # type: ignore
+    from psycopg2 import extras as pg_extras  # type: ignore
 except Exception:
     psycopg2 = None  # type: ignore
     PGError = Exception  # type: ignore
+    pg_pool = None  # type: ignore
+    pg_extras = None  # type: ignore
+
+try:
+    from mysql.connector import pooling as mysql_pooling  # type: ignore
+except Exception:
+    mysql_pooling = None  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+# Taille du pool de connexions par DatabaseConnection
+POOL_MIN_CONN = 1
+POOL_MAX_CONN = 20
+MYSQL_POOL_SIZE = 5
+# Attente maximale (secondes) d'une connexion libre avant PoolSaturee
+POOL_TIMEOUT = 10
+
+
+class PoolSaturee(RuntimeError):
+    """
+    Aucune connexion du pool ne s'est libérée dans le délai POOL_TIMEOUT.
+    
+    Volontairement distincte des erreurs du pilote (MySQLError/PGError) que les
+    modèles interceptent : elle remonte jusqu'à la vue, qui prévient l'utilisateur.
+    """
 
 """#-----------------------------------------
 -- Ajouter TOUTES les colonnes nécessaires en une fois
@@ -32,6 +67,171 @@ ADD COLUMN IF NOT EXISTS model_image_name VARCHAR(255) AFTER model_image;
 #--------------------------------------------
 """
 
+
+def _float0(v) -> float:
+    """Convertit en float, 0.0 si la valeur est vide (NULL ou 0)."""
+    return float(v) if v else 0.0
+
+
+def _gen_row_builder(cols):
+    """
+    Génère une fonction row -> dict spécialisée pour une forme de SELECT.
+
+    Args:
+        cols: Liste de (clé, conversion) dans l'ordre des colonnes du SELECT ;
+              conversion vaut None ou le nom d'une fonction ('float', 'int', '_float0').
+
+    Returns:
+        Fonction b(r) retournant le dict littéral de la ligne.
+    """
+    champs = []
+    for i, (cle, conv) in enumerate(cols):
+        expr = f"r[{i}]" if conv is None else f"{conv}(r[{i}])"
+        champs.append(f"{cle!r}: {expr}")
+    src = "def b(r): return {" + ", ".join(champs) + "}"
+    ns: Dict = {}
+    exec(src, {"float": float, "int": int, "_float0": _float0}, ns)
+    return ns["b"]
+
+
+def _float_sql(db_type: str, expr: str) -> str:
+    """
+    Expression SQL convertissant un DECIMAL en flottant double côté base,
+    pour que le pilote renvoie directement des float Python (pas de Decimal).
+    MySQL : addition d'un littéral DOUBLE (0E0), CAST(... AS DOUBLE) n'existant
+    qu'à partir de MySQL 8.0.17 (absent des MariaDB fournies avec XAMPP).
+    """
+    if db_type == 'mysql':
+        return f"({expr}) + 0E0"
+    return f"({expr})::float8"
+
+
+def _fetch_rows(cursor, build, arraysize: int = 1000) -> List[Dict]:
+    """
+    Lit le résultat par lots (fetchmany) et construit les dicts au fil de l'eau,
+    sans matérialiser toute la liste de tuples en une fois.
+
+    Args:
+        cursor: Curseur déjà exécuté
+        build: Fonction row -> dict
+        arraysize: Taille des lots
+
+    Returns:
+        Liste des dicts construits
+    """
+    cursor.arraysize = arraysize
+    lignes: List[Dict] = []
+    while True:
+        batch = cursor.fetchmany()
+        if not batch:
+            break
+        lignes.extend(build(r) for r in batch)
+    return lignes
+
+
+_COLS_FERMEES_ONE = [
+    ('id', None), ('modele', None),
+    ('prix_total', 'float'), ('avance', 'float'), ('reste', 'float'),
+    ('statut', None), ('date_creation', None), ('date_fermeture', None),
+    ('client_nom', None), ('client_prenom', None),
+    ('couturier_salon_id', None),
+]
+_COLS_FERMEES_ALL = _COLS_FERMEES_ONE[:-1] + [
+    ('couturier_id', None), ('couturier_nom', None), ('couturier_prenom', None),
+    ('couturier_salon_id', None),
+]
+_BUILD_FERMEES_ALL = _gen_row_builder(_COLS_FERMEES_ALL)
+_BUILD_FERMEES_ONE = _gen_row_builder(_COLS_FERMEES_ONE)
+
+_BUILD_CALENDRIER = _gen_row_builder([
+    ('id', None), ('modele', None),
+    ('prix_total', 'float'), ('avance', 'float'), ('reste', 'float'),
+    ('statut', None), ('date_creation', None), ('date_livraison', None),
+    ('client_nom', None), ('client_prenom', None), ('client_telephone', None),
+    ('couturier_id', None), ('couturier_nom', None), ('couturier_prenom', None),
+    ('couturier_email', None), ('couturier_telephone', None),
+    ('couturier_salon_id', None),
+])
+_COLS_CHARGES_BASIC = [
+    ('id', None), ('type', None), ('categorie', None), ('description', None),
+    # montant est converti en flottant côté SQL (voir _float_sql)
+    ('montant', None), ('date_charge', None), ('date_creation', None),
+    ('reference', None), ('commande_id', None), ('employe_id', None),
+]
+_COLS_CHARGES_JOIN = _COLS_CHARGES_BASIC + [
+    ('couturier_id', None), ('couturier_nom', None), ('couturier_prenom', None),
+]
+_BUILD_CHARGES_BASIC = _gen_row_builder(_COLS_CHARGES_BASIC)
+_BUILD_CHARGES_COUT = _gen_row_builder(_COLS_CHARGES_BASIC + [('couturier_id', None)])
+_BUILD_CHARGES_JOIN = _gen_row_builder(_COLS_CHARGES_JOIN)
+# Fabrique de lignes selon le nombre de colonnes du SELECT (cursor.description)
+_BUILD_CHARGES_PAR_NCOLS = {
+    len(_COLS_CHARGES_BASIC): _BUILD_CHARGES_BASIC,
+    len(_COLS_CHARGES_BASIC) + 1: _BUILD_CHARGES_COUT,
+    len(_COLS_CHARGES_JOIN): _BUILD_CHARGES_JOIN,
+}
+_BUILD_MODELES_REALISES = _gen_row_builder([
+    ('modele', None), ('categorie', None), ('sexe', None),
+    ('nb_commandes', 'int'), ('ca_total', 'float'),
+])
+_BUILD_COMMANDES_IMAGES = _gen_row_builder([
+    ('id', None), ('modele', None), ('categorie', None), ('sexe', None),
+    ('prix_total', 'float'), ('date_creation', None),
+    ('client_nom', None), ('client_prenom', None),
+    ('fabric_image', None), ('fabric_image_name', None),
+    ('model_image', None), ('model_image_name', None),
+    ('couturier_nom', None), ('couturier_prenom', None),
+])
+_BUILD_DEMANDES_VALIDATION = _gen_row_builder([
+    ('id', None), ('commande_id', None), ('couturier_id', None), ('type_action', None),
+    ('montant_paye', '_float0'), ('reste_apres_paiement', '_float0'),
+    ('commentaire', None), ('date_creation', None),
+    ('statut_avant', None), ('statut_apres', None),
+    ('modele', None), ('prix_total', 'float'), ('avance', 'float'), ('reste', 'float'),
+    ('client_nom', None), ('client_prenom', None),
+    ('couturier_nom', None), ('couturier_prenom', None),
+    ('salon_id', None), ('salon_nom', None),
+])
+
+
+# Instructions préparées côté serveur, par connexion brute :
+# PostgreSQL -> noms déjà PREPARE ; MySQL -> curseurs prepared=True par nom
+_PREPARED_PG: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+_PREPARED_MYSQL: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+_RE_PLACEHOLDER = re.compile(r"%s")
+
+
+def _placeholders_pg(query: str) -> str:
+    """Convertit les marqueurs %s en $1, $2, ... pour un PREPARE PostgreSQL."""
+    compteur = iter(range(1, query.count("%s") + 1))
+    return _RE_PLACEHOLDER.sub(lambda _m: f"${next(compteur)}", query)
+
+def _rendre_connexion(db_type: str, pool, conn):
+    """Rend une connexion au pool."""
+    if db_type == 'postgresql':
+        # putconn annule une éventuelle transaction encore ouverte
+        pool.putconn(conn)
+    else:
+        # Pas de reset de session : terminer la transaction (et son snapshot)
+        try:
+            conn.rollback()
+        finally:
+            conn.close()
+
+
+def _restituer_connexion_principale(db_type: str, pool, places, conn):
+    """
+    Rend au pool partagé la connexion principale d'une instance issue de
+    partager_pool (disconnect() ou collecte de l'instance en fin de session).
+    """
+    try:
+        _rendre_connexion(db_type, pool, conn)
+    except Exception:
+        pass  # Pool déjà fermé : la connexion est perdue avec lui
+    finally:
+        places.release()
+
+
 class DatabaseConnection:
     """Classe pour gérer la connexion à la base de données"""
     
@@ -46,18 +246,30 @@ class DatabaseConnection:
         self.db_type = db_type
         self.config = config
         self.connection = None
+        self.pool = None
+        # Places libres dans le pool (hors connexion principale), cf. _acquerir
+        self._places: Optional[threading.BoundedSemaphore] = None
+        # Message de la dernière erreur de connect() (None après un succès)
+        self._last_error: Optional[str] = None
+        # Restitution de la connexion principale si le pool est partagé (cf. partager_pool)
+        self._restitution: Optional[weakref.finalize] = None
         
     def connect(self) -> bool:
         """
         Établit la connexion à la base de données
         
+        En cas d'échec, le message d'erreur du pilote est conservé dans
+        self._last_error (évite une seconde tentative pour le diagnostiquer).
+        
         Returns:
             True si succès, False sinon
         """
+        self._last_error = None
         try:
             if self.db_type == 'postgresql':
                 if psycopg2 is None:
-                    print("psycopg2 non installé")
+                    self._last_error = "psycopg2 non installé"
+                    print(self._last_error)
                     return False
                 conn_params = {
                     'host': self.config['host'],
@@ -69,37 +281,235 @@ class DatabaseConnection:
                 # SSL requis pour Render PostgreSQL
                 if self.config.get('sslmode'):
                     conn_params['sslmode'] = self.config['sslmode']
-                self.connection = psycopg2.connect(**conn_params)
+                self.pool = pg_pool.ThreadedConnectionPool(
+                    POOL_MIN_CONN, POOL_MAX_CONN, **conn_params
+                )
+                # Connexion principale (get_connection) prise dans le pool
+                self.connection = self.pool.getconn()
+                self._places = threading.BoundedSemaphore(POOL_MAX_CONN - 1)
                 return True
             elif self.db_type == 'mysql':
                 if mysql is None:
-                    print("mysql-connector-python non installé")
+                    self._last_error = "mysql-connector-python non installé"
+                    print(self._last_error)
                     return False
-                self.connection = mysql.connector.connect(
+                self.pool = mysql_pooling.MySQLConnectionPool(
+                    pool_name=f"couturier_{id(self)}",
+                    # Le pool MySQL ouvre toutes ses connexions dès sa création
+                    pool_size=MYSQL_POOL_SIZE,
+                    # Conserver la session : les instructions préparées survivent au retour au pool
+                    pool_reset_session=False,
                     host=self.config['host'],
                     port=int(self.config['port']),
                     database=self.config['database'],
                     user=self.config['user'],
                     password=self.config['password']
                 )
+                self.connection = self.pool.get_connection()
+                self._places = threading.BoundedSemaphore(MYSQL_POOL_SIZE - 1)
                 return True
             else:
-                print(f"Type de base de données non supporté: {self.db_type}")
+                self._last_error = f"Type de base de données non supporté: {self.db_type}"
+                print(self._last_error)
                 return False
         except (MySQLError, PGError, Exception) as e:
+            self._last_error = str(e)
             print(f"Erreur de connexion: {e}")
             return False
     
+    def partager_pool(self) -> "DatabaseConnection":
+        """
+        Nouvelle instance sur le même pool, avec sa propre connexion principale
+        (get_connection) : transactions, commits et rollbacks restent propres
+        à chaque session. Le pool n'est jamais fermé par l'instance partagée ;
+        sa connexion principale revient au pool à disconnect() ou quand
+        l'instance est collectée (fin de session).
+        
+        Raises:
+            PoolSaturee: Aucune connexion libérée dans le délai
+        """
+        db = DatabaseConnection(self.db_type, self.config)
+        db.pool = self.pool
+        db._places = self._places
+        db.connection = self._acquerir()
+        db._restitution = weakref.finalize(
+            db, _restituer_connexion_principale,
+            self.db_type, self.pool, self._places, db.connection,
+        )
+        return db
+    
     def disconnect(self):
-        """Ferme la connexion"""
-        if self.connection:
-            self.connection.close()
-            self.connection = None
+        """Ferme la connexion et toutes les connexions du pool"""
+        if self._restitution is not None:
+            # Pool partagé : rendre la connexion principale, sans fermer le pool
+            self._restitution()
+            self._restitution = None
+            self.pool = None
+            self._places = None
+        elif self.pool is None:
+            if self.connection:
+                self.connection.close()
+        else:
+            if self.connection:
+                self._liberer(self.connection)
+            if self.db_type == 'postgresql':
+                self.pool.closeall()
+            else:
+                # Ferme les connexions MySQL restées dans la file du pool
+                self.pool._remove_connections()
+            self.pool = None
+            self._places = None
+        self.connection = None
     
     def get_connection(self):
         """Retourne l'objet de connexion"""
         return self.connection
     
+    def _acquerir(self):
+        """
+        Prend une connexion dans le pool (connexion principale à défaut de pool).
+        
+        Attend au plus POOL_TIMEOUT secondes qu'une connexion se libère : les pools
+        des pilotes lèvent immédiatement une erreur quand ils sont vides.
+        
+        Raises:
+            PoolSaturee: Aucune connexion libérée dans le délai
+        """
+        if self.pool is None:
+            return self.connection
+        if not self._places.acquire(timeout=POOL_TIMEOUT):
+            raise PoolSaturee(
+                f"Aucune connexion disponible après {POOL_TIMEOUT} s (pool saturé)"
+            )
+        try:
+            if self.db_type == 'postgresql':
+                return self.pool.getconn()
+            return self.pool.get_connection()
+        except BaseException:
+            self._places.release()
+            raise
+    
+    def _liberer(self, conn):
+        """Rend une connexion au pool."""
+        _rendre_connexion(self.db_type, self.pool, conn)
+    
+    @contextmanager
+    def acquire(self, lecture_seule: bool = False):
+        """
+        Connexion du pool pour la durée du bloc, rendue au pool en sortie
+        (y compris en cas d'erreur, après rollback).
+        
+        Args:
+            lecture_seule: Bloc sans écriture. En PostgreSQL, la connexion passe
+                en autocommit le temps du bloc : chaque SELECT s'exécute seul
+                (READ COMMITTED), sans BEGIN ni transaction laissée ouverte.
+        
+        Usage:
+            with self.db.acquire() as conn:
+                cur = conn.cursor()
+                ...
+                conn.commit()
+        """
+        conn = self._acquerir()
+        autocommit = (
+            lecture_seule and self.db_type == 'postgresql' and conn is not self.connection
+        )
+        if autocommit:
+            conn.autocommit = True
+        try:
+            yield conn
+        except BaseException:
+            try:
+                conn.rollback()
+            except (MySQLError, PGError):
+                pass
+            raise
+        finally:
+            if autocommit:
+                conn.autocommit = False
+            if conn is not self.connection:
+                try:
+                    self._liberer(conn)
+                finally:
+                    self._places.release()
+    
+    @contextmanager
+    def cursor(self, lecture_seule: bool = False, **kwargs):
+        """
+        Curseur sur une connexion du pool (cf. acquire), fermé en sortie de bloc.
+        
+        Usage:
+            with self.db.cursor() as (cur, conn):
+                cur.execute(...)
+                conn.commit()
+        """
+        with self.acquire(lecture_seule) as conn:
+            cur = conn.cursor(**kwargs)
+            try:
+                yield cur, conn
+            finally:
+                cur.close()
+
+    def execute_prepared(self, cursor, nom: str, query: str, params: Tuple = (), conn=None):
+        """
+        Exécute une requête via une instruction préparée côté serveur.
+        La préparation (parse + plan) n'a lieu qu'une fois par connexion,
+        les appels suivants ne font que l'exécuter avec de nouveaux paramètres.
+
+        Args:
+            cursor: Curseur de l'appelant (utilisé tel quel en PostgreSQL)
+            nom: Nom stable de l'instruction (unique par texte SQL)
+            query: Requête avec marqueurs %s
+            params: Paramètres positionnels
+            conn: Connexion du curseur (connexion principale par défaut)
+
+        Returns:
+            Curseur à lire (fetchone/fetchmany/fetchall)
+        """
+        if conn is None:
+            conn = self.get_connection()
+        if self.db_type == 'postgresql':
+            prepares = _PREPARED_PG.setdefault(conn, set())
+            if nom not in prepares:
+                cursor.execute(f"PREPARE {nom} AS {_placeholders_pg(query)}")
+                prepares.add(nom)
+            if params:
+                marqueurs = ", ".join(["%s"] * len(params))
+                cursor.execute(f"EXECUTE {nom} ({marqueurs})", tuple(params))
+            else:
+                cursor.execute(f"EXECUTE {nom}")
+            return cursor
+        # MySQL : un curseur prepared=True conservé par connexion physique et par nom
+        # (une PooledMySQLConnection enveloppe la connexion réelle dans _cnx)
+        brute = getattr(conn, '_cnx', conn)
+        curseurs = _PREPARED_MYSQL.setdefault(brute, {})
+        cur_prep = curseurs.get(nom)
+        if cur_prep is None:
+            cur_prep = brute.cursor(prepared=True)
+            curseurs[nom] = cur_prep
+        cur_prep.execute(query, tuple(params))
+        return cur_prep
+    
+    def insert_returning_id(self, cursor, query: str, params: Tuple = (), col: str = 'id'):
+        """
+        Exécute un INSERT et renvoie l'identifiant généré de la ligne
+        (RETURNING en PostgreSQL, lastrowid en MySQL).
+
+        Args:
+            cursor: Curseur de l'appelant
+            query: INSERT sans clause RETURNING
+            params: Paramètres positionnels
+            col: Colonne auto-incrémentée (PostgreSQL)
+
+        Returns:
+            Identifiant de la ligne insérée
+        """
+        if self.db_type == 'postgresql':
+            cursor.execute(f"{query} RETURNING {col}", params)
+            return cursor.fetchone()[0]
+        cursor.execute(query, params)
+        return cursor.lastrowid
+    
     def is_connected(self) -> bool:
         """Vérifie si la connexion est active"""
         if self.connection is None:
@@ -113,6 +523,139 @@ class DatabaseConnection:
             return False
 
 
+def _jour_debut(valeur) -> Optional[datetime]:
+    """Ramène une borne de début de période au début de sa journée."""
+    if not valeur:
+        return None
+    jour = valeur.date() if isinstance(valeur, datetime) else valeur
+    return datetime.combine(jour, time.min)
+
+
+def _jour_fin(valeur) -> Optional[datetime]:
+    """Ramène une borne de fin de période à la fin de sa journée."""
+    if not valeur:
+        return None
+    jour = valeur.date() if isinstance(valeur, datetime) else valeur
+    return datetime.combine(jour, time.max)
+
+
+class _RefConnexion:
+    """
+    Connexion transmise à une fonction mémoïsée sans entrer dans la clé du cache :
+    toutes les instances sont égales, et seule une référence faible est gardée
+    (le cache ne retient donc pas les connexions).
+    """
+    __slots__ = ("_ref",)
+
+    def __init__(self, db: "DatabaseConnection"):
+        self._ref = weakref.ref(db)
+
+    def __call__(self) -> Optional["DatabaseConnection"]:
+        return self._ref()
+
+    def __hash__(self) -> int:
+        return 0
+
+    def __eq__(self, autre) -> bool:
+        return isinstance(autre, _RefConnexion)
+
+
+def _cle_base(db: "DatabaseConnection") -> Tuple:
+    """Identifiant stable de la base visée (indépendant de l'objet connexion)."""
+    config = db.config or {}
+    return (db.db_type, config.get('host'), str(config.get('port', '')), config.get('database'))
+
+
+@functools.lru_cache(maxsize=256)
+def _lister_modeles_realises_cached(
+    cle_base: Tuple,
+    ref_db: _RefConnexion,
+    salon_id: Optional[str],
+    couturier_id: Optional[int],
+    date_debut: Optional[datetime],
+    date_fin: Optional[datetime],
+    jour: int,
+) -> Tuple[Dict, ...]:
+    """
+    Agrégat des modèles réalisés, mémoïsé par (base, salon, couturier, jours).
+    `jour` (ordinal du jour courant) renouvelle les entrées chaque jour.
+    Les erreurs SQL sont propagées (et donc jamais mises en cache).
+    Invalidé par CommandeModel._invalidate_reports().
+    """
+    where_clauses = ["1=1"]
+    params = []
+    if salon_id:
+        where_clauses.append("co.salon_id = %s")
+        params.append(salon_id)
+    if couturier_id:
+        where_clauses.append("c.couturier_id = %s")
+        params.append(couturier_id)
+    if date_debut:
+        where_clauses.append("c.date_creation >= %s")
+        params.append(date_debut)
+    if date_fin:
+        where_clauses.append("c.date_creation <= %s")
+        params.append(date_fin)
+    where_sql = " AND ".join(where_clauses)
+    query = f"""
+        SELECT c.modele, c.categorie, c.sexe,
+               COUNT(*) as nb_commandes, COALESCE(SUM(c.prix_total), 0) as ca_total
+        FROM commandes c
+        LEFT JOIN couturiers co ON c.couturier_id = co.id
+        WHERE {where_sql}
+        GROUP BY c.modele, c.categorie, c.sexe
+        ORDER BY nb_commandes DESC, ca_total DESC
+    """
+    with ref_db().cursor(lecture_seule=True) as (cursor, _conn):
+        cursor.execute(query, tuple(params))
+        return tuple(_fetch_rows(cursor, _BUILD_MODELES_REALISES))
+
+
+# Durée de vie (secondes) du cache salon -> couturiers
+_COUTURIERS_SALON_TTL = 60
+
+
+# Dernière fenêtre de temps servie par _couturiers_du_salon (cf. purge ci-dessous)
+_tranche_couturiers: Optional[int] = None
+
+
+@functools.lru_cache(maxsize=256)
+def _couturiers_du_salon_cached(
+    cle_base: Tuple, ref_db: _RefConnexion, salon_id: str, tranche: int
+) -> Tuple:
+    """
+    Couturiers d'un salon : tuple de (id, nom, prenom), mémoïsé par base et salon.
+    `tranche` est la fenêtre de temps courante, ce qui borne la fraîcheur à la TTL.
+    """
+    with ref_db().cursor() as (cursor, conn):
+        cursor.execute(
+            "SELECT id, nom, prenom FROM couturiers WHERE salon_id = %s ORDER BY id",
+            (salon_id,)
+        )
+        return tuple(tuple(r) for r in cursor.fetchall())
+
+
+def _couturiers_du_salon(db: "DatabaseConnection", salon_id: str) -> Tuple:
+    """Couturiers d'un salon (cache avec TTL, voir _couturiers_du_salon_cached)."""
+    global _tranche_couturiers
+    tranche = int(monotonic() // _COUTURIERS_SALON_TTL)
+    if tranche != _tranche_couturiers:
+        # Nouvelle fenêtre : les entrées des fenêtres passées ne servent plus
+        _couturiers_du_salon_cached.cache_clear()
+        _tranche_couturiers = tranche
+    return _couturiers_du_salon_cached(_cle_base(db), _RefConnexion(db), salon_id, tranche)
+
+
+def invalider_cache_couturiers():
+    """
+    Vide le cache salon -> couturiers et le cache des salons, qui contient le nom
+    de l'admin (à appeler après création/suppression d'un couturier ou changement de rôle).
+    """
+    _couturiers_du_salon_cached.cache_clear()
+    from models.salon_model import SalonModel
+    SalonModel.invalider_cache()
+
+
 class CouturierModel:
     """Modèle pour la gestion des couturiers"""
     
@@ -359,6 +902,7 @@ class CouturierModel:
                 cursor.execute("UPDATE couturiers SET salon_id = %s WHERE id = %s", (user_id, user_id))
             
             self.db.get_connection().commit()
+            invalider_cache_couturiers()
             cursor.close()
             return user_id
         except (MySQLError, PGError, Exception) as e:
@@ -431,6 +975,7 @@ class CouturierModel:
             query = "UPDATE couturiers SET role = %s WHERE id = %s"
             cursor.execute(query, (nouveau_role, couturier_id))
             self.db.get_connection().commit()
+            invalider_cache_couturiers()
             cursor.close()
             return True
         except (MySQLError, PGError, Exception) as e:
@@ -452,6 +997,7 @@ class CouturierModel:
             query = "DELETE FROM couturiers WHERE id = %s"
             cursor.execute(query, (couturier_id,))
             self.db.get_connection().commit()
+            invalider_cache_couturiers()
             cursor.close()
             return True
         except (MySQLError, PGError, Exception) as e:
@@ -627,7 +1173,9 @@ class CommandeModel:
     def __init__(self, db_connection: DatabaseConnection):
         self.db = db_connection
 
-
+    def _invalidate_reports(self):
+        """Vide les caches de rapports après une modification des commandes."""
+        _lister_modeles_realises_cached.cache_clear()
 
     def ajouter_commande(self, client_id: int, couturier_id: int, 
                          categorie: str, sexe: str, modele: str,
@@ -719,6 +1267,7 @@ class CommandeModel:
                 commande_id = cursor.fetchone()[0]
 
             connection.commit()
+            self._invalidate_reports()
             cursor.close()
             return commande_id
 
@@ -1001,14 +1550,10 @@ class CommandeModel:
                 commande_id, couturier_id, montant_paye, reste_apres,
                 statut_avant, statut_apres, commentaire
             )
-            if self.db.db_type == 'mysql':
-                cursor.execute(hist_query, params)
-                hist_id = cursor.lastrowid
-            else:
-                cursor.execute(hist_query + " RETURNING id", params)
-                hist_id = cursor.fetchone()[0]
+            hist_id = self.db.insert_returning_id(cursor, hist_query, params)
             
             connection.commit()
+            self._invalidate_reports()
             cursor.close()
             return hist_id
             
@@ -1081,6 +1626,7 @@ class CommandeModel:
             cursor.execute(update_query, (prix_total, avance, reste, commande_id))
             
             connection.commit()
+            self._invalidate_reports()
             cursor.close()
             return True
             
@@ -1152,12 +1698,7 @@ class CommandeModel:
                 VALUES (%s, %s, 'fermeture_demande', 0, %s, %s, 'Livré et payé', %s, 'en_attente')
             """
             params = (commande_id, couturier_id, reste, statut_avant, commentaire)
-            if self.db.db_type == 'mysql':
-                cursor.execute(hist_query, params)
-                hist_id = cursor.lastrowid
-            else:
-                cursor.execute(hist_query + " RETURNING id", params)
-                hist_id = cursor.fetchone()[0]
+            hist_id = self.db.insert_returning_id(cursor, hist_query, params)
 
             connection.commit()
             cursor.close()
@@ -1262,6 +1803,7 @@ class CommandeModel:
                 pass
             
             connection.commit()
+            self._invalidate_reports()
             cursor.close()
             return True
             
@@ -1395,44 +1937,11 @@ class CommandeModel:
                 query += " ORDER BY c.date_fermeture DESC"
                 cursor.execute(query, tuple(params))
 
-            results = cursor.fetchall()
+            build = _BUILD_FERMEES_ALL if tous_les_couturiers else _BUILD_FERMEES_ONE
+            commandes = _fetch_rows(cursor, build)
             cursor.close()
-
-            commandes = []
-            for row in results:
-                if tous_les_couturiers:
-                    commandes.append({
-                        'id': row[0],
-                        'modele': row[1],
-                        'prix_total': float(row[2]),
-                        'avance': float(row[3]),
-                        'reste': float(row[4]),
-                        'statut': row[5],
-                        'date_creation': row[6],
-                        'date_fermeture': row[7],
-                        'client_nom': row[8],
-                        'client_prenom': row[9],
-                        'couturier_id': row[10],
-                        'couturier_nom': row[11],
-                        'couturier_prenom': row[12],
-                        'couturier_salon_id': row[13],
-                    })
-                else:
-                    commandes.append({
-                        'id': row[0],
-                        'modele': row[1],
-                        'prix_total': float(row[2]),
-                        'avance': float(row[3]),
-                        'reste': float(row[4]),
-                        'statut': row[5],
-                        'date_creation': row[6],
-                        'date_fermeture': row[7],
-                        'client_nom': row[8],
-                        'client_prenom': row[9],
-                        'couturier_salon_id': row[10],
-                    })
             return commandes
-        except (MySQLError, PGError, Exception) as e:
+        except (MySQLError, PGError) as e:
             print(f"Erreur liste commandes fermées: {e}")
             return []
     
@@ -1498,31 +2007,10 @@ class CommandeModel:
                     params.insert(1, salon_id)
                 query += " ORDER BY c.date_livraison ASC"
                 cursor.execute(query, tuple(params))
-            results = cursor.fetchall()
+            commandes = _fetch_rows(cursor, _BUILD_CALENDRIER)
             cursor.close()
-            commandes = []
-            for row in results:
-                commandes.append({
-                    'id': row[0],
-                    'modele': row[1],
-                    'prix_total': float(row[2]),
-                    'avance': float(row[3]),
-                    'reste': float(row[4]),
-                    'statut': row[5],
-                    'date_creation': row[6],
-                    'date_livraison': row[7],
-                    'client_nom': row[8],
-                    'client_prenom': row[9],
-                    'client_telephone': row[10],
-                    'couturier_id': row[11],
-                    'couturier_nom': row[12],
-                    'couturier_prenom': row[13],
-                    'couturier_email': row[14],
-                    'couturier_telephone': row[15] if len(row) > 15 else None,
-                    'couturier_salon_id': row[16] if len(row) > 16 else None,
-                })
             return commandes
-        except (MySQLError, PGError, Exception) as e:
+        except (MySQLError, PGError) as e:
             print(f"Erreur liste commandes calendrier: {e}")
             return []
 
@@ -1539,45 +2027,17 @@ class CommandeModel:
         Retourne: modele, categorie, sexe, nb_commandes, ca_total.
         """
         try:
-            cursor = self.db.get_connection().cursor()
-            where_clauses = ["1=1"]
-            params = []
-            if salon_id:
-                where_clauses.append("co.salon_id = %s")
-                params.append(salon_id)
-            if couturier_id and not tous_les_couturiers:
-                where_clauses.append("c.couturier_id = %s")
-                params.append(couturier_id)
-            if date_debut:
-                where_clauses.append("c.date_creation >= %s")
-                params.append(date_debut)
-            if date_fin:
-                where_clauses.append("c.date_creation <= %s")
-                params.append(date_fin)
-            where_sql = " AND ".join(where_clauses)
-            query = f"""
-                SELECT c.modele, c.categorie, c.sexe,
-                       COUNT(*) as nb_commandes, COALESCE(SUM(c.prix_total), 0) as ca_total
-                FROM commandes c
-                LEFT JOIN couturiers co ON c.couturier_id = co.id
-                WHERE {where_sql}
-                GROUP BY c.modele, c.categorie, c.sexe
-                ORDER BY nb_commandes DESC, ca_total DESC
-            """
-            cursor.execute(query, tuple(params))
-            results = cursor.fetchall()
-            cursor.close()
-            return [
-                {
-                    "modele": row[0],
-                    "categorie": row[1],
-                    "sexe": row[2],
-                    "nb_commandes": int(row[3]),
-                    "ca_total": float(row[4]),
-                }
-                for row in results
-            ]
-        except (MySQLError, PGError, Exception) as e:
+            modeles = _lister_modeles_realises_cached(
+                _cle_base(self.db),
+                _RefConnexion(self.db),
+                salon_id,
+                None if tous_les_couturiers else couturier_id,
+                _jour_debut(date_debut),
+                _jour_fin(date_fin),
+                datetime.now().toordinal(),
+            )
+            return [dict(m) for m in modeles]
+        except (MySQLError, PGError) as e:
             print(f"Erreur liste modèles réalisés: {e}")
             return []
 
@@ -1623,35 +2083,18 @@ class CommandeModel:
                 ORDER BY c.date_creation DESC
             """
             cursor.execute(query, tuple(params))
-            results = cursor.fetchall()
+            commandes = _fetch_rows(cursor, _BUILD_COMMANDES_IMAGES)
             cursor.close()
-            return [
-                {
-                    "id": row[0],
-                    "modele": row[1],
-                    "categorie": row[2],
-                    "sexe": row[3],
-                    "prix_total": float(row[4]),
-                    "date_creation": row[5],
-                    "client_nom": row[6],
-                    "client_prenom": row[7],
-                    "fabric_image": row[8],
-                    "fabric_image_name": row[9],
-                    "model_image": row[10],
-                    "model_image_name": row[11],
-                    "couturier_nom": row[12],
-                    "couturier_prenom": row[13],
-                }
-                for row in results
-            ]
-        except (MySQLError, PGError, Exception) as e:
+            return commandes
+        except (MySQLError, PGError) as e:
             print(f"Erreur liste commandes avec images: {e}")
             return []
 
     def creer_table_rappels_livraison(self) -> bool:
         """Crée la table rappels_livraison si elle n'existe pas."""
         try:
-            cursor = self.db.get_connection().cursor()
+            conn = self.db.get_connection()
+            cursor = conn.cursor()
             if self.db.db_type == 'mysql':
                 cursor.execute("""
                     CREATE TABLE IF NOT EXISTS rappels_livraison (
@@ -1676,10 +2119,10 @@ class CommandeModel:
                         UNIQUE (commande_id, date_livraison)
                     )
                 """)
-            self.db.get_connection().commit()
+            conn.commit()
             cursor.close()
             return True
-        except (MySQLError, PGError, Exception) as e:
+        except (MySQLError, PGError) as e:
             print(f"Erreur création table rappels_livraison: {e}")
             return False
 
@@ -1694,13 +2137,14 @@ class CommandeModel:
             ok = cursor.fetchone() is not None
             cursor.close()
             return ok
-        except Exception:
+        except (MySQLError, PGError):
             return False
 
     def enregistrer_rappel_envoye(self, commande_id: int, couturier_id: int, date_livraison) -> bool:
         """Enregistre qu'un rappel a été envoyé au couturier pour cette commande."""
         try:
-            cursor = self.db.get_connection().cursor()
+            conn = self.db.get_connection()
+            cursor = conn.cursor()
             cursor.execute(
                 """
                 INSERT INTO rappels_livraison (commande_id, couturier_id, date_livraison)
@@ -1708,10 +2152,10 @@ class CommandeModel:
                 """,
                 (commande_id, couturier_id, date_livraison)
             )
-            self.db.get_connection().commit()
+            conn.commit()
             cursor.close()
             return True
-        except Exception as e:
+        except (MySQLError, PGError) as e:
             print(f"Erreur enregistrement rappel: {e}")
             return False
 
@@ -1762,35 +2206,10 @@ class CommandeModel:
                 ORDER BY h.date_creation DESC
             """
             cursor.execute(query, tuple(params))
-            results = cursor.fetchall()
+            demandes = _fetch_rows(cursor, _BUILD_DEMANDES_VALIDATION)
             cursor.close()
-            
-            demandes = []
-            for row in results:
-                demandes.append({
-                    'id': row[0],
-                    'commande_id': row[1],
-                    'couturier_id': row[2],
-                    'type_action': row[3],
-                    'montant_paye': float(row[4]) if row[4] else 0.0,
-                    'reste_apres_paiement': float(row[5]) if row[5] else 0.0,
-                    'commentaire': row[6],
-                    'date_creation': row[7],
-                    'statut_avant': row[8],
-                    'statut_apres': row[9],
-                    'modele': row[10],
-                    'prix_total': float(row[11]),
-                    'avance': float(row[12]),
-                    'reste': float(row[13]),
-                    'client_nom': row[14],
-                    'client_prenom': row[15],
-                    'couturier_nom': row[16],
-                    'couturier_prenom': row[17],
-                    'salon_id': row[18],
-                    'salon_nom': row[19],
-                })
             return demandes
-        except (MySQLError, PGError, Exception) as e:
+        except (MySQLError, PGError) as e:
             print(f"Erreur liste demandes validation: {e}")
             return []
 
@@ -1804,79 +2223,98 @@ class ChargesModel:
     def creer_tables(self) -> bool:
         """Crée les tables des charges et des documents liés"""
         try:
-            cursor = self.db.get_connection().cursor()
-            
-            if self.db.db_type == 'mysql':
-                # Table des charges
-                cursor.execute(
-                    """
-                    CREATE TABLE IF NOT EXISTS charges (
-                        id INT AUTO_INCREMENT PRIMARY KEY,
-                        couturier_id INT NOT NULL,
-                        type VARCHAR(20) NOT NULL,
-                        categorie VARCHAR(50) NOT NULL,
-                        description VARCHAR(255),
-                        montant DECIMAL(12,2) NOT NULL,
-                        date_charge DATE NOT NULL,
-                        commande_id INT NULL,
-                        employe_id INT NULL,
-                        fichier_justificatif VARCHAR(500),
-                        date_creation TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        FOREIGN KEY (couturier_id) REFERENCES couturiers(id)
+            with self.db.cursor() as (cursor, conn):
+                if self.db.db_type == 'mysql':
+                    # Table des charges
+                    cursor.execute(
+                        """
+                        CREATE TABLE IF NOT EXISTS charges (
+                            id INT AUTO_INCREMENT PRIMARY KEY,
+                            couturier_id INT NOT NULL,
+                            type VARCHAR(20) NOT NULL,
+                            categorie VARCHAR(50) NOT NULL,
+                            description VARCHAR(255),
+                            montant DECIMAL(12,2) NOT NULL,
+                            date_charge DATE NOT NULL,
+                            commande_id INT NULL,
+                            employe_id INT NULL,
+                            fichier_justificatif VARCHAR(500),
+                            date_creation TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                            FOREIGN KEY (couturier_id) REFERENCES couturiers(id)
+                        )
+                        """
                     )
-                    """
-                )
-                # Table des documents liés aux charges
-                cursor.execute(
-                    """
-                    CREATE TABLE IF NOT EXISTS charge_documents (
-                        id INT AUTO_INCREMENT PRIMARY KEY,
-                        charge_id INT NOT NULL,
-                        file_path VARCHAR(500) NOT NULL,
-                        file_name VARCHAR(255) NOT NULL,
-                        mime_type VARCHAR(100),
-                        uploaded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        FOREIGN KEY (charge_id) REFERENCES charges(id) ON DELETE CASCADE
+                    # Table des documents liés aux charges
+                    cursor.execute(
+                        """
+                        CREATE TABLE IF NOT EXISTS charge_documents (
+                            id INT AUTO_INCREMENT PRIMARY KEY,
+                            charge_id INT NOT NULL,
+                            file_path VARCHAR(500) NOT NULL,
+                            file_name VARCHAR(255) NOT NULL,
+                            mime_type VARCHAR(100),
+                            uploaded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                            FOREIGN KEY (charge_id) REFERENCES charges(id) ON DELETE CASCADE
+                        )
+                        """
                     )
-                    """
-                )
-            else:
-                # PostgreSQL
-                cursor.execute(
-                    """
-                    CREATE TABLE IF NOT EXISTS charges (
-                        id SERIAL PRIMARY KEY,
-                        couturier_id INTEGER NOT NULL REFERENCES couturiers(id),
-                        type VARCHAR(20) NOT NULL,
-                        categorie VARCHAR(50) NOT NULL,
-                        description VARCHAR(255),
-                        montant DECIMAL(12,2) NOT NULL,
-                        date_charge DATE NOT NULL,
-                        commande_id INTEGER NULL,
-                        employe_id INTEGER NULL,
-                        fichier_justificatif VARCHAR(500),
-                        date_creation TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    # Index pour ORDER BY date_charge DESC, id DESC LIMIT (sans tri complet)
+                    for index_sql in (
+                        "CREATE INDEX idx_charges_cout_date ON charges(couturier_id, date_charge DESC, id DESC)",
+                        "CREATE INDEX idx_couturiers_salon_id ON couturiers(salon_id, id)",
+                        # Index couvrant pour SUM(montant) par couturier et période
+                        "CREATE INDEX idx_charges_sum ON charges(couturier_id, date_charge, montant)",
+                    ):
+                        try:
+                            cursor.execute(index_sql)
+                        except MySQLError:
+                            pass  # Index déjà existant
+                else:
+                    # PostgreSQL
+                    cursor.execute(
+                        """
+                        CREATE TABLE IF NOT EXISTS charges (
+                            id SERIAL PRIMARY KEY,
+                            couturier_id INTEGER NOT NULL REFERENCES couturiers(id),
+                            type VARCHAR(20) NOT NULL,
+                            categorie VARCHAR(50) NOT NULL,
+                            description VARCHAR(255),
+                            montant DECIMAL(12,2) NOT NULL,
+                            date_charge DATE NOT NULL,
+                            commande_id INTEGER NULL,
+                            employe_id INTEGER NULL,
+                            fichier_justificatif VARCHAR(500),
+                            date_creation TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                        )
+                        """
                     )
-                    """
-                )
-                cursor.execute(
-                    """
-                    CREATE TABLE IF NOT EXISTS charge_documents (
-                        id SERIAL PRIMARY KEY,
-                        charge_id INTEGER NOT NULL REFERENCES charges(id) ON DELETE CASCADE,
-                        file_path VARCHAR(500) NOT NULL,
-                        file_name VARCHAR(255) NOT NULL,
-                        mime_type VARCHAR(100),
-                        uploaded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    cursor.execute(
+                        """
+                        CREATE TABLE IF NOT EXISTS charge_documents (
+                            id SERIAL PRIMARY KEY,
+                            charge_id INTEGER NOT NULL REFERENCES charges(id) ON DELETE CASCADE,
+                            file_path VARCHAR(500) NOT NULL,
+                            file_name VARCHAR(255) NOT NULL,
+                            mime_type VARCHAR(100),
+                            uploaded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                        )
+                        """
+                    )
+                    # Index couvrant pour ORDER BY date_charge DESC, id DESC LIMIT (index-only scan) ;
+                    # il couvre aussi SUM(montant) par couturier et période (montant en INCLUDE)
+                    cursor.execute(
+                        "CREATE INDEX IF NOT EXISTS idx_charges_cout_date "
+                        "ON charges(couturier_id, date_charge DESC, id DESC) "
+                        "INCLUDE (type, categorie, description, montant)"
+                    )
+                    cursor.execute(
+                        "CREATE INDEX IF NOT EXISTS idx_couturiers_salon_id ON couturiers(salon_id, id)"
                     )
-                    """
-                )
             
-            self.db.get_connection().commit()
-            cursor.close()
-            return True
-        except (MySQLError, PGError, Exception) as e:
-            print(f"Erreur création tables charges: {e}")
+                conn.commit()
+                return True
+        except (MySQLError, PGError) as e:
+            logger.warning("Erreur création tables charges: %s", e)
             return False
 
     def ajouter_charge(self, couturier_id: int, type_charge: str, categorie: str,
@@ -1903,32 +2341,21 @@ class ChargesModel:
             ID de la charge créée ou None si erreur
         """
         try:
-            cursor = self.db.get_connection().cursor()
-            
-            if self.db.db_type == 'mysql':
+            with self.db.cursor() as (cursor, conn):
                 query = (
                     "INSERT INTO charges (couturier_id, type, categorie, description, montant, date_charge, "
                     "commande_id, employe_id, fichier_justificatif, reference) "
                     "VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)"
                 )
-                cursor.execute(query, (couturier_id, type_charge, categorie, description, montant, 
-                                       date_charge, commande_id, employe_id, fichier_justificatif, reference))
-                charge_id = cursor.lastrowid
-            else:
-                query = (
-                    "INSERT INTO charges (couturier_id, type, categorie, description, montant, date_charge, "
-                    "commande_id, employe_id, fichier_justificatif, reference) "
-                    "VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s) RETURNING id"
-                )
-                cursor.execute(query, (couturier_id, type_charge, categorie, description, montant, 
-                                       date_charge, commande_id, employe_id, fichier_justificatif, reference))
-                charge_id = cursor.fetchone()[0]
+                charge_id = self.db.insert_returning_id(cursor, query, (
+                    couturier_id, type_charge, categorie, description, montant,
+                    date_charge, commande_id, employe_id, fichier_justificatif, reference
+                ))
             
-            self.db.get_connection().commit()
-            cursor.close()
-            return charge_id
-        except (MySQLError, PGError, Exception) as e:
-            print(f"Erreur ajout charge: {e}")
+                conn.commit()
+                return charge_id
+        except (MySQLError, PGError) as e:
+            logger.warning("Erreur ajout charge: %s", e)
             return None
 
     def ajouter_document(self, charge_id: int, file_name: str, 
@@ -1954,33 +2381,31 @@ class ChargesModel:
         try:
             # Validation : file_data est obligatoire
             if not file_data:
-                print("Erreur: file_data est obligatoire (stockage uniquement en BDD)")
+                logger.warning("Erreur: file_data est obligatoire (stockage uniquement en BDD)")
                 return False
             
-            cursor = self.db.get_connection().cursor()
-            
-            # Calculer la taille si non fournie
-            if file_size is None:
-                file_size = len(file_data)
+            with self.db.cursor() as (cursor, conn):
+                # Calculer la taille si non fournie
+                if file_size is None:
+                    file_size = len(file_data)
             
-            query = (
-                "INSERT INTO charge_documents "
-                "(charge_id, file_name, mime_type, file_size, file_data, description) "
-                "VALUES (%s, %s, %s, %s, %s, %s)"
-            )
-            cursor.execute(query, (
-                charge_id, 
-                file_name, 
-                mime_type,
-                file_size,
-                file_data,
-                description
-            ))
-            self.db.get_connection().commit()
-            cursor.close()
-            return True
-        except (MySQLError, PGError, Exception) as e:
-            print(f"Erreur ajout document charge: {e}")
+                query = (
+                    "INSERT INTO charge_documents "
+                    "(charge_id, file_name, mime_type, file_size, file_data, description) "
+                    "VALUES (%s, %s, %s, %s, %s, %s)"
+                )
+                cursor.execute(query, (
+                    charge_id, 
+                    file_name, 
+                    mime_type,
+                    file_size,
+                    file_data,
+                    description
+                ))
+                conn.commit()
+                return True
+        except (MySQLError, PGError) as e:
+            logger.warning("Erreur ajout document charge: %s", e)
             return False
     
     def recuperer_document(self, document_id: int) -> Optional[Dict]:
@@ -1994,30 +2419,29 @@ class ChargesModel:
             Dictionnaire avec les informations du document ou None
         """
         try:
-            cursor = self.db.get_connection().cursor()
-            query = (
-                "SELECT id, charge_id, file_name, mime_type, file_size, "
-                "file_data, uploaded_at, description "
-                "FROM charge_documents WHERE id = %s"
-            )
-            cursor.execute(query, (document_id,))
-            row = cursor.fetchone()
-            cursor.close()
+            with self.db.cursor() as (cursor, conn):
+                query = (
+                    "SELECT id, charge_id, file_name, mime_type, file_size, "
+                    "file_data, uploaded_at, description "
+                    "FROM charge_documents WHERE id = %s"
+                )
+                cursor.execute(query, (document_id,))
+                row = cursor.fetchone()
             
-            if row:
-                return {
-                    'id': row[0],
-                    'charge_id': row[1],
-                    'file_name': row[2],
-                    'mime_type': row[3],
-                    'file_size': row[4],
-                    'file_data': row[5],
-                    'uploaded_at': row[6],
-                    'description': row[7]
-                }
-            return None
-        except (MySQLError, PGError, Exception) as e:
-            print(f"Erreur récupération document: {e}")
+                if row:
+                    return {
+                        'id': row[0],
+                        'charge_id': row[1],
+                        'file_name': row[2],
+                        'mime_type': row[3],
+                        'file_size': row[4],
+                        'file_data': row[5],
+                        'uploaded_at': row[6],
+                        'description': row[7]
+                    }
+                return None
+        except (MySQLError, PGError) as e:
+            logger.warning("Erreur récupération document: %s", e)
             return None
     
     def lister_documents_charge(self, charge_id: int) -> List[Dict]:
@@ -2031,29 +2455,28 @@ class ChargesModel:
             Liste des documents
         """
         try:
-            cursor = self.db.get_connection().cursor()
-            query = (
-                "SELECT id, file_name, mime_type, file_size, "
-                "uploaded_at, description "
-                "FROM charge_documents WHERE charge_id = %s ORDER BY uploaded_at DESC"
-            )
-            cursor.execute(query, (charge_id,))
-            rows = cursor.fetchall()
-            cursor.close()
+            with self.db.cursor() as (cursor, conn):
+                query = (
+                    "SELECT id, file_name, mime_type, file_size, "
+                    "uploaded_at, description "
+                    "FROM charge_documents WHERE charge_id = %s ORDER BY uploaded_at DESC"
+                )
+                cursor.execute(query, (charge_id,))
+                rows = cursor.fetchall()
             
-            return [
-                {
-                    'id': r[0],
-                    'file_name': r[1],
-                    'mime_type': r[2],
-                    'file_size': r[3],
-                    'uploaded_at': r[4],
-                    'description': r[5]
-                }
-                for r in rows
-            ]
-        except (MySQLError, PGError, Exception) as e:
-            print(f"Erreur liste documents charge: {e}")
+                return [
+                    {
+                        'id': r[0],
+                        'file_name': r[1],
+                        'mime_type': r[2],
+                        'file_size': r[3],
+                        'uploaded_at': r[4],
+                        'description': r[5]
+                    }
+                    for r in rows
+                ]
+        except (MySQLError, PGError) as e:
+            logger.warning("Erreur liste documents charge: %s", e)
             return []
 
     def total_charges(self, couturier_id: Optional[int] = None, 
@@ -2074,47 +2497,48 @@ class ChargesModel:
             Total des charges en FCFA
         """
         try:
-            cursor = self.db.get_connection().cursor()
-            where = []
-            params: List = []
-            
-            if tous_les_couturiers and not salon_id:
-                # Tout voir
-                pass
-            elif salon_id and couturier_id:
-                # Filtrer par couturier_id ET salon_id (sécurité multi-tenant)
-                where.append("couturier_id = %s AND couturier_id IN (SELECT id FROM couturiers WHERE salon_id = %s)")
-                params.append(couturier_id)
-                params.append(salon_id)
-            elif salon_id:
-                where.append("couturier_id IN (SELECT id FROM couturiers WHERE salon_id = %s)")
-                params.append(salon_id)
-            elif couturier_id:
-                where.append("couturier_id = %s")
-                params.append(couturier_id)
-            else:
-                return 0.0
-            
-            if date_debut:
-                where.append("date_charge >= %s")
-                params.append(date_debut)
-            if date_fin:
-                where.append("date_charge <= %s")
-                params.append(date_fin)
+            with self.db.cursor() as (cursor, conn):
+                where = []
+                params: List = []
             
-            where_clause = " WHERE " + " AND ".join(where) if where else ""
-            query = f"SELECT COALESCE(SUM(montant), 0) FROM charges{where_clause}"
-            cursor.execute(query, tuple(params))
-            total = cursor.fetchone()[0] or 0
-            cursor.close()
-            return float(total)
-        except (MySQLError, PGError, Exception) as e:
-            print(f"Erreur total charges: {e}")
+                if tous_les_couturiers and not salon_id:
+                    # Tout voir
+                    pass
+                elif salon_id and couturier_id:
+                    # Filtrer par couturier_id ET salon_id (sécurité multi-tenant)
+                    where.append("couturier_id = %s AND couturier_id IN (SELECT id FROM couturiers WHERE salon_id = %s)")
+                    params.append(couturier_id)
+                    params.append(salon_id)
+                elif salon_id:
+                    where.append("couturier_id IN (SELECT id FROM couturiers WHERE salon_id = %s)")
+                    params.append(salon_id)
+                elif couturier_id:
+                    where.append("couturier_id = %s")
+                    params.append(couturier_id)
+                else:
+                    return 0.0
+            
+                if date_debut:
+                    where.append("date_charge >= %s")
+                    params.append(date_debut)
+                if date_fin:
+                    where.append("date_charge <= %s")
+                    params.append(date_fin)
+            
+                where_clause = " WHERE " + " AND ".join(where) if where else ""
+                total_sql = _float_sql(self.db.db_type, "COALESCE(SUM(montant), 0)")
+                query = f"SELECT {total_sql} FROM charges{where_clause}"
+                cursor.execute(query, tuple(params))
+                # COALESCE garantit une valeur non NULL, déjà flottante (cast SQL)
+                return cursor.fetchone()[0]
+        except (MySQLError, PGError) as e:
+            logger.warning("Erreur total charges: %s", e)
             return 0.0
 
     def lister_charges(self, couturier_id: Optional[int] = None, limit: int = 50, 
                        tous_les_couturiers: bool = False,
-                       salon_id: Optional[str] = None) -> List[Dict]:
+                       salon_id: Optional[str] = None,
+                       apres_date=None, apres_id: Optional[int] = None) -> List[Dict]:
         """
         Liste les charges d'un couturier ou de tous les couturiers (pour admin)
         
@@ -2122,108 +2546,141 @@ class ChargesModel:
             couturier_id: ID du couturier (None si admin veut voir tout)
             limit: Nombre maximum de charges à retourner
             tous_les_couturiers: Si True, retourne toutes les charges de tous les couturiers
+            apres_date, apres_id: Curseur de pagination (date_charge et id de la
+                dernière charge de la page précédente) ; None pour la première page
             
         Returns:
             Liste des charges
         """
         try:
-            cursor = self.db.get_connection().cursor()
-            
-            if tous_les_couturiers and not salon_id:
-                # SUPER_ADMIN : toutes les charges
-                query = (
-                    "SELECT c.id, c.type, c.categorie, c.description, c.montant, c.date_charge, "
-                    "c.date_creation, c.reference, c.commande_id, c.employe_id, c.couturier_id, "
-                    "cout.nom, cout.prenom "
-                    "FROM charges c "
-                    "LEFT JOIN couturiers cout ON c.couturier_id = cout.id "
-                    "ORDER BY c.date_charge DESC, c.id DESC LIMIT %s"
-                )
-                cursor.execute(query, (limit,))
-            elif salon_id and couturier_id:
-                # Employé : filtrer par couturier_id ET salon_id (sécurité multi-tenant)
-                query = (
-                    "SELECT c.id, c.type, c.categorie, c.description, c.montant, c.date_charge, "
-                    "c.date_creation, c.reference, c.commande_id, c.employe_id, c.couturier_id, "
-                    "cout.nom, cout.prenom "
-                    "FROM charges c "
-                    "LEFT JOIN couturiers cout ON c.couturier_id = cout.id "
-                    "WHERE c.couturier_id = %s AND cout.salon_id = %s "
-                    "ORDER BY c.date_charge DESC, c.id DESC LIMIT %s"
-                )
-                cursor.execute(query, (couturier_id, salon_id, limit))
-            elif salon_id:
-                # Admin : filtre par salon via couturiers
-                query = (
-                    "SELECT c.id, c.type, c.categorie, c.description, c.montant, c.date_charge, "
-                    "c.date_creation, c.reference, c.commande_id, c.employe_id, c.couturier_id, "
-                    "cout.nom, cout.prenom "
-                    "FROM charges c "
-                    "LEFT JOIN couturiers cout ON c.couturier_id = cout.id "
-                    "WHERE cout.salon_id = %s "
-                    "ORDER BY c.date_charge DESC, c.id DESC LIMIT %s"
-                )
-                cursor.execute(query, (salon_id, limit))
+            # Pagination par clé (date_charge, id) : le parcours d'index démarre
+            # au curseur au lieu de lire puis d'écarter les lignes précédentes
+            pagine = apres_date is not None and apres_id is not None
+            if not pagine:
+                apres_sql, apres_params = "", ()
+            elif self.db.db_type == 'postgresql':
+                apres_sql = " AND ({p}date_charge, {p}id) < (%s, %s)"
+                apres_params = (apres_date, apres_id)
             else:
-                # Employé : voir uniquement ses propres charges (sans filtre salon_id)
-                query = (
-                    "SELECT id, type, categorie, description, montant, date_charge, date_creation, "
-                    "reference, commande_id, employe_id "
-                    "FROM charges WHERE couturier_id = %s ORDER BY date_charge DESC, id DESC LIMIT %s"
-                )
-                cursor.execute(query, (couturier_id, limit))
-            
-            rows = cursor.fetchall()
-            cursor.close()
-            
-            # Détecter le format selon le nombre de colonnes retournées
-            # Si on a fait un JOIN avec couturiers, on a 13 colonnes
-            # Sinon, on a 10 colonnes
-            if rows and len(rows[0]) > 10:
-                # Format avec informations du couturier (JOIN avec couturiers)
-                return [
-                    {
-                        'id': r[0],
-                        'type': r[1],
-                        'categorie': r[2],
-                        'description': r[3],
-                        'montant': float(r[4]),
-                        'date_charge': r[5],
-                        'date_creation': r[6],
-                        'reference': r[7] if len(r) > 7 else None,
-                        'commande_id': r[8] if len(r) > 8 else None,
-                        'employe_id': r[9] if len(r) > 9 else None,
-                        'couturier_id': r[10] if len(r) > 10 else None,
-                        'couturier_nom': r[11] if len(r) > 11 else None,
-                        'couturier_prenom': r[12] if len(r) > 12 else None
-                    }
-                    for r in rows
-                ]
-            else:
-                # Format standard (sans JOIN)
-                return [
-                    {
-                        'id': r[0],
-                        'type': r[1],
-                        'categorie': r[2],
-                        'description': r[3],
-                        'montant': float(r[4]),
-                        'date_charge': r[5],
-                        'date_creation': r[6],
-                        'reference': r[7] if len(r) > 7 else None,
-                        'commande_id': r[8] if len(r) > 8 else None,
-                        'employe_id': r[9] if len(r) > 9 else None
-                    }
-                    for r in rows
-                ]
-        except (MySQLError, PGError, Exception) as e:
-            print(f"Erreur liste charges: {e}")
+                apres_sql = " AND ({p}date_charge < %s OR ({p}date_charge = %s AND {p}id < %s))"
+                apres_params = (apres_date, apres_date, apres_id)
+            suffixe = "_apres" if pagine else ""
+            # PostgreSQL : lignes construites en dict directement par psycopg2
+            lignes_dict = self.db.db_type == 'postgresql' and pg_extras is not None
+            options = {'cursor_factory': pg_extras.RealDictCursor} if lignes_dict else {}
+            
+            noms = None
+            if salon_id:
+                # Filtre salon sans JOIN : ids des couturiers du salon (cache court)
+                couturiers = _couturiers_du_salon(self.db, salon_id)
+                noms = {c[0]: (c[1], c[2]) for c in couturiers}
+                if couturier_id:
+                    # Employé : filtrer par couturier_id ET salon_id (sécurité multi-tenant)
+                    ids = [int(couturier_id)] if int(couturier_id) in noms else []
+                else:
+                    # Admin : toutes les charges des couturiers du salon
+                    ids = list(noms)
+                if not ids:
+                    return []
+            
+            with self.db.cursor(**options) as (cursor, conn):
+                if noms is not None:
+                    montant_sql = _float_sql(self.db.db_type, "montant")
+                    colonnes = (
+                        "SELECT id, type, categorie, description, "
+                        f"{montant_sql} AS montant, date_charge, date_creation, "
+                        "reference, commande_id, employe_id, couturier_id "
+                        "FROM charges "
+                    )
+                    ordre = " ORDER BY date_charge DESC, id DESC LIMIT %s"
+                    filtre_apres = apres_sql.format(p="")
+                    if self.db.db_type == 'postgresql':
+                        query = colonnes + "WHERE couturier_id = ANY(%s)" + filtre_apres + ordre
+                        resultat = self.db.execute_prepared(
+                            cursor, 'list_charges_salon' + suffixe, query,
+                            (ids, *apres_params, limit), conn=conn
+                        )
+                    else:
+                        marqueurs = ", ".join(["%s"] * len(ids))
+                        query = colonnes + f"WHERE couturier_id IN ({marqueurs})" + filtre_apres + ordre
+                        cursor.execute(query, (*ids, *apres_params, limit))
+                        resultat = cursor
+                else:
+                    # Une seule requête pour les autres cas : le filtre couturier est
+                    # activé par une sentinelle booléenne, le texte SQL reste constant.
+                    # SUPER_ADMIN : toutes les charges ; employé : ses propres charges
+                    montant_sql = _float_sql(self.db.db_type, "c.montant")
+                    query = (
+                        "SELECT c.id, c.type, c.categorie, c.description, "
+                        f"{montant_sql} AS montant, c.date_charge, "
+                        "c.date_creation, c.reference, c.commande_id, c.employe_id, c.couturier_id, "
+                        "cout.nom AS couturier_nom, cout.prenom AS couturier_prenom "
+                        "FROM charges c "
+                        "LEFT JOIN couturiers cout ON c.couturier_id = cout.id "
+                        "WHERE (%s OR c.couturier_id = %s)" + apres_sql.format(p="c.") +
+                        " ORDER BY c.date_charge DESC, c.id DESC LIMIT %s"
+                    )
+                    params = (bool(tous_les_couturiers), couturier_id or 0, *apres_params, limit)
+                    resultat = self.db.execute_prepared(
+                        cursor, 'list_charges' + suffixe, query, params, conn=conn
+                    )
+                
+                if lignes_dict:
+                    # Clés = alias du SELECT (RealDictCursor)
+                    charges = resultat.fetchall()
+                else:
+                    # Forme du résultat lue avant tout fetch (10, 11 ou 13 colonnes)
+                    build = _BUILD_CHARGES_PAR_NCOLS[len(resultat.description)]
+                    # resultat peut être le curseur préparé mis en cache (non fermé ici)
+                    charges = _fetch_rows(resultat, build, arraysize=max(1, min(limit, 500)))
+            
+            if noms is not None:
+                for charge in charges:
+                    charge['couturier_nom'], charge['couturier_prenom'] = noms.get(
+                        charge['couturier_id'], (None, None)
+                    )
+            return charges
+        except (MySQLError, PGError) as e:
+            logger.warning("Erreur liste charges: %s", e)
             return []
 
 
+# Types MIME non compressés nativement : stockés compressés (zlib) dans app_logo
+_MIME_LOGO_COMPRESSIBLES = ('image/svg+xml', 'image/bmp', 'image/x-icon')
+
+
+def _compresser_logo(data: bytes, mime_type: Optional[str]) -> Tuple[bytes, bool]:
+    """
+    Compresse le logo si son format s'y prête (SVG, BMP, texte...).
+    PNG/JPEG/WebP/GIF sont déjà compressés et stockés tels quels.
+
+    Returns:
+        (données à stocker, True si compressées)
+    """
+    mime = (mime_type or '').lower()
+    if mime in _MIME_LOGO_COMPRESSIBLES or mime.startswith('text/'):
+        compresse = zlib.compress(data, 6)
+        if len(compresse) < len(data):
+            return compresse, True
+    return data, False
+
+
+def _decompresser_logo(data, compresse) -> Optional[bytes]:
+    """Restaure le contenu d'origine d'un logo lu depuis app_logo."""
+    if data and compresse:
+        return zlib.decompress(data)
+    return data
+
+
 class AppLogoModel:
     """Modèle pour la gestion du logo de l'application (multi-tenant)"""
     
+    # Colonnes lisibles via recuperer_logo (liste blanche pour la projection)
+    CHAMPS_LOGO = frozenset({
+        'logo_data', 'logo_name', 'mime_type', 'file_size',
+        'uploaded_at', 'uploaded_by', 'description'
+    })
+    
     def __init__(self, db_connection: DatabaseConnection):
         """
         Initialise le modèle
@@ -2241,49 +2698,59 @@ class AppLogoModel:
             True si succès, False sinon
         """
         try:
-            cursor = self.db.get_connection().cursor()
-            
-            # Créer la table app_logo avec salon_id
-            if self.db.db_type == 'mysql':
-                query = """
-                CREATE TABLE IF NOT EXISTS app_logo (
-                    salon_id VARCHAR(50) PRIMARY KEY COMMENT 'ID du salon propriétaire du logo',
-                    logo_data LONGBLOB NOT NULL COMMENT 'Contenu binaire du logo',
-                    logo_name VARCHAR(255) NOT NULL COMMENT 'Nom original du fichier',
-                    mime_type VARCHAR(100) NOT NULL COMMENT 'Type MIME (ex: image/png, image/jpeg)',
-                    file_size BIGINT NOT NULL COMMENT 'Taille du logo en octets',
-                    uploaded_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP COMMENT 'Date d\\'upload',
-                    uploaded_by INT NULL COMMENT 'ID de l\\'administrateur qui a uploadé',
-                    description VARCHAR(255) NULL COMMENT 'Description optionnelle',
-                    FOREIGN KEY (uploaded_by) REFERENCES couturiers(id) 
-                        ON DELETE SET NULL 
-                        ON UPDATE CASCADE
-                ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
-                COMMENT='Table stockant les logos des salons (un logo par salon)'
-                """
-            else:  # PostgreSQL
-                query = """
-                CREATE TABLE IF NOT EXISTS app_logo (
-                    salon_id VARCHAR(50) PRIMARY KEY,
-                    logo_data BYTEA NOT NULL,
-                    logo_name VARCHAR(255) NOT NULL,
-                    mime_type VARCHAR(100) NOT NULL,
-                    file_size BIGINT NOT NULL,
-                    uploaded_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
-                    uploaded_by INT NULL,
-                    description VARCHAR(255) NULL,
-                    FOREIGN KEY (uploaded_by) REFERENCES couturiers(id) 
-                        ON DELETE SET NULL 
-                        ON UPDATE CASCADE
-                )
-                """
+            with self.db.cursor() as (cursor, conn):
+                # Créer la table app_logo avec salon_id
+                if self.db.db_type == 'mysql':
+                    query = """
+                    CREATE TABLE IF NOT EXISTS app_logo (
+                        salon_id VARCHAR(50) PRIMARY KEY COMMENT 'ID du salon propriétaire du logo',
+                        logo_data LONGBLOB NOT NULL COMMENT 'Contenu binaire du logo',
+                        logo_name VARCHAR(255) NOT NULL COMMENT 'Nom original du fichier',
+                        mime_type VARCHAR(100) NOT NULL COMMENT 'Type MIME (ex: image/png, image/jpeg)',
+                        file_size BIGINT NOT NULL COMMENT 'Taille du logo en octets',
+                        uploaded_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP COMMENT 'Date d\\'upload',
+                        uploaded_by INT NULL COMMENT 'ID de l\\'administrateur qui a uploadé',
+                        description VARCHAR(255) NULL COMMENT 'Description optionnelle',
+                        FOREIGN KEY (uploaded_by) REFERENCES couturiers(id) 
+                            ON DELETE SET NULL 
+                            ON UPDATE CASCADE
+                    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+                    COMMENT='Table stockant les logos des salons (un logo par salon)'
+                    """
+                else:  # PostgreSQL
+                    query = """
+                    CREATE TABLE IF NOT EXISTS app_logo (
+                        salon_id VARCHAR(50) PRIMARY KEY,
+                        logo_data BYTEA NOT NULL,
+                        logo_name VARCHAR(255) NOT NULL,
+                        mime_type VARCHAR(100) NOT NULL,
+                        file_size BIGINT NOT NULL,
+                        uploaded_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                        uploaded_by INT NULL,
+                        description VARCHAR(255) NULL,
+                        FOREIGN KEY (uploaded_by) REFERENCES couturiers(id) 
+                            ON DELETE SET NULL 
+                            ON UPDATE CASCADE
+                    )
+                    """
             
-            cursor.execute(query)
-            self.db.get_connection().commit()
-            cursor.close()
-            return True
-        except (MySQLError, PGError, Exception) as e:
-            print(f"Erreur création table app_logo: {e}")
+                cursor.execute(query)
+                # Indicateur de compression (ajouté aussi aux tables existantes)
+                if self.db.db_type == 'mysql':
+                    try:
+                        cursor.execute(
+                            "ALTER TABLE app_logo ADD COLUMN compressed BOOLEAN NOT NULL DEFAULT FALSE"
+                        )
+                    except MySQLError:
+                        pass  # Colonne déjà présente
+                else:
+                    cursor.execute(
+                        "ALTER TABLE app_logo ADD COLUMN IF NOT EXISTS compressed BOOLEAN NOT NULL DEFAULT FALSE"
+                    )
+                conn.commit()
+                return True
+        except (MySQLError, PGError) as e:
+            logger.warning("Erreur création table app_logo: %s", e)
             return False
     
     def sauvegarder_logo(self, salon_id: str, logo_data: bytes, logo_name: str, 
@@ -2305,79 +2772,106 @@ class AppLogoModel:
         """
         try:
             if not logo_data:
-                print("Erreur: logo_data est obligatoire")
+                logger.warning("Erreur: logo_data est obligatoire")
                 return False
             
-            cursor = self.db.get_connection().cursor()
-            file_size = len(logo_data)
-            
-            # Vérifier si un logo existe déjà pour ce salon
-            cursor.execute("SELECT COUNT(*) FROM app_logo WHERE salon_id = %s", (salon_id,))
-            exists = cursor.fetchone()[0] > 0
+            with self.db.cursor() as (cursor, conn):
+                # file_size reste la taille d'origine, même si le contenu est compressé
+                file_size = len(logo_data)
+                donnees, compresse = _compresser_logo(logo_data, mime_type)
             
-            if exists:
-                # Mettre à jour le logo existant
-                query = """
-                UPDATE app_logo 
-                SET logo_data = %s, logo_name = %s, mime_type = %s, 
-                    file_size = %s, uploaded_at = CURRENT_TIMESTAMP,
-                    uploaded_by = %s, description = %s
-                WHERE salon_id = %s
-                """
-                cursor.execute(query, (
-                    logo_data, logo_name, mime_type, file_size,
-                    uploaded_by, description, salon_id
-                ))
-            else:
-                # Insérer un nouveau logo
-                query = """
-                INSERT INTO app_logo (salon_id, logo_data, logo_name, mime_type, file_size, uploaded_by, description)
-                VALUES (%s, %s, %s, %s, %s, %s, %s)
-                """
+                # UPSERT : un seul aller-retour, l'existence est vérifiée par la base
+                if self.db.db_type == 'mysql':
+                    query = """
+                    INSERT INTO app_logo (salon_id, logo_data, logo_name, mime_type, file_size, uploaded_by, description,
+                                          compressed)
+                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+                    ON DUPLICATE KEY UPDATE
+                        logo_data = VALUES(logo_data), logo_name = VALUES(logo_name),
+                        mime_type = VALUES(mime_type), file_size = VALUES(file_size),
+                        uploaded_at = CURRENT_TIMESTAMP,
+                        uploaded_by = VALUES(uploaded_by), description = VALUES(description),
+                        compressed = VALUES(compressed)
+                    """
+                else:  # PostgreSQL
+                    query = """
+                    INSERT INTO app_logo (salon_id, logo_data, logo_name, mime_type, file_size, uploaded_by, description,
+                                          compressed)
+                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+                    ON CONFLICT (salon_id) DO UPDATE SET
+                        logo_data = EXCLUDED.logo_data, logo_name = EXCLUDED.logo_name,
+                        mime_type = EXCLUDED.mime_type, file_size = EXCLUDED.file_size,
+                        uploaded_at = CURRENT_TIMESTAMP,
+                        uploaded_by = EXCLUDED.uploaded_by, description = EXCLUDED.description,
+                        compressed = EXCLUDED.compressed
+                    """
                 cursor.execute(query, (
-                    salon_id, logo_data, logo_name, mime_type, file_size,
-                    uploaded_by, description
+                    salon_id, donnees, logo_name, mime_type, file_size,
+                    uploaded_by, description, compresse
                 ))
             
-            self.db.get_connection().commit()
-            cursor.close()
-            return True
-        except (MySQLError, PGError, Exception) as e:
-            print(f"Erreur sauvegarde logo: {e}")
+                conn.commit()
+                return True
+        except (MySQLError, PGError) as e:
+            logger.warning("Erreur sauvegarde logo: %s", e)
             return False
     
-    def recuperer_logo(self, salon_id: str) -> Optional[Dict]:
+    def recuperer_logo(self, salon_id: str,
+                       champs: Tuple[str, ...] = ('logo_data', 'mime_type')) -> Optional[Dict]:
         """
         Récupère le logo d'un salon
         
         Args:
             salon_id: ID du salon
+            champs: Colonnes à lire parmi CHAMPS_LOGO (par défaut contenu et type MIME)
             
         Returns:
-            Dictionnaire avec les données du logo ou None si non trouvé
+            Dictionnaire {champ: valeur} ou None si non trouvé
         """
+        inconnus = set(champs) - self.CHAMPS_LOGO
+        if inconnus:
+            raise ValueError(f"Champs de logo inconnus : {sorted(inconnus)}")
+        champs = tuple(champs)
+        avec_contenu = 'logo_data' in champs
+        colonnes = champs + ('compressed',) if avec_contenu else champs
         try:
-            cursor = self.db.get_connection().cursor()
-            cursor.execute("""
-                SELECT logo_data, logo_name, mime_type, file_size, 
-                       uploaded_at, uploaded_by, description
-                FROM app_logo 
-                WHERE salon_id = %s
-            """, (salon_id,))
-            row = cursor.fetchone()
-            cursor.close()
+            with self.db.cursor() as (cursor, conn):
+                cursor.execute(
+                    f"SELECT {', '.join(colonnes)} FROM app_logo WHERE salon_id = %s",
+                    (salon_id,)
+                )
+                row = cursor.fetchone()
             
-            if row and row[0]:  # Vérifier que logo_data n'est pas vide
-                return {
-                    'logo_data': row[0],
-                    'logo_name': row[1],
-                    'mime_type': row[2],
-                    'file_size': row[3],
-                    'uploaded_at': row[4],
-                    'uploaded_by': row[5],
-                    'description': row[6]
-                }
+            if not row:
+                return None
+            logo = dict(zip(champs, row))
+            if avec_contenu:
+                if not logo['logo_data']:  # Vérifier que logo_data n'est pas vide
+                    return None
+                logo['logo_data'] = _decompresser_logo(logo['logo_data'], row[-1])
+            return logo
+        except (MySQLError, PGError) as e:
+            logger.warning("Erreur récupération logo: %s", e)
             return None
-        except (MySQLError, PGError, Exception) as e:
-            print(f"Erreur récupération logo: {e}")
+    
+    def recuperer_logo_bytes(self, salon_id: str) -> Optional[bytes]:
+        """
+        Récupère uniquement le contenu binaire du logo d'un salon
+        
+        Args:
+            salon_id: ID du salon
+            
+        Returns:
+            Contenu du logo (bytes, ou memoryview avec psycopg2) ou None si non trouvé
+        """
+        try:
+            with self.db.cursor() as (cursor, conn):
+                cursor.execute("SELECT logo_data, compressed FROM app_logo WHERE salon_id = %s", (salon_id,))
+                row = cursor.fetchone()
+            
+                if row and row[0]:
+                    return _decompresser_logo(row[0], row[1])
+                return None
+        except (MySQLError, PGError) as e:
+            logger.warning("Erreur récupération contenu logo: %s", e)
             return None
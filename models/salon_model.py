@@ -1,7 +1,14 @@
 """
 Modèle pour la gestion des salons (système multi-tenant)
 """
-from typing import Optional, Dict, List
+import logging
+import threading
+import weakref
+from typing import Optional, Dict, Iterator, List
+
+from cachetools import TTLCache
+
+from models.database import invalider_cache_couturiers
 
 try:
     from mysql.connector import Error as MySQLError  # type: ignore
@@ -13,9 +20,127 @@ try:
 except Exception:
     PGError = Exception  # type: ignore
 
+logger = logging.getLogger(__name__)
+
+# Présence de la table salons par DatabaseConnection (cf. SalonModel._verifier_table_salons)
+_TABLE_SALONS_PRESENTE: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+# Valeur par défaut de modifier_salon : champ non fourni, laissé tel quel (None vide le champ)
+_INCHANGE = object()
+
+
+def _routine_absente(erreur: Exception) -> bool:
+    """Vrai si l'erreur signale une procédure (MySQL 1305) ou une fonction (PostgreSQL 42883) inexistante."""
+    return getattr(erreur, 'pgcode', None) == '42883' or getattr(erreur, 'errno', None) == 1305
+
+
+# Colonnes d'un salon (obtenir_salon_*) et clés du dict retourné, dans le même ordre
+_COLONNES_SALON = """
+    s.salon_id, s.nom, s.quartier, s.responsable, s.telephone, s.email,
+    s.code_admin, s.actif, s.date_creation,
+    s.smtp_host, s.smtp_port, s.smtp_user, s.smtp_password,
+    s.smtp_from, s.smtp_use_tls, s.smtp_use_ssl
+"""
+_CLES_SALON = (
+    'salon_id', 'nom_salon', 'quartier', 'responsable', 'telephone', 'email',
+    'code_admin', 'actif', 'date_creation',
+    'smtp_host', 'smtp_port', 'smtp_user', 'smtp_password',
+    'smtp_from', 'smtp_use_tls', 'smtp_use_ssl',
+)
+
+
+# Tous les salons avec statistiques agrégées (une seule requête, pas de N+1)
+_REQUETE_SALONS_STATS = """
+    SELECT s.salon_id,
+           s.nom,
+           s.quartier,
+           s.responsable,
+           s.telephone,
+           s.email,
+           s.code_admin,
+           s.actif,
+           s.date_creation,
+           s.smtp_host,
+           s.smtp_port,
+           s.smtp_user,
+           s.smtp_from,
+           s.smtp_use_tls,
+           s.smtp_use_ssl,
+           COALESCE(emp.nb_employes, 0),
+           COALESCE(cli.nb_clients, 0),
+           COALESCE(cmd.nb_commandes, 0),
+           COALESCE(cmd.ca_total, 0),
+           adm.nom,
+           adm.prenom
+    FROM salons s
+    LEFT JOIN (
+        SELECT salon_id,
+               SUM(CASE WHEN role = 'employe' THEN 1 ELSE 0 END) AS nb_employes,
+               MIN(CASE WHEN role = 'admin' THEN id END) AS admin_id
+        FROM couturiers
+        GROUP BY salon_id
+    ) emp ON emp.salon_id = s.salon_id
+    LEFT JOIN (
+        SELECT salon_id, COUNT(*) AS nb_clients
+        FROM clients
+        GROUP BY salon_id
+    ) cli ON cli.salon_id = s.salon_id
+    LEFT JOIN (
+        SELECT salon_id, COUNT(*) AS nb_commandes, SUM(prix_total) AS ca_total
+        FROM commandes
+        GROUP BY salon_id
+    ) cmd ON cmd.salon_id = s.salon_id
+    LEFT JOIN couturiers adm ON adm.id = emp.admin_id
+    ORDER BY s.salon_id
+"""
+
+
+def _salon_depuis_ligne(row) -> Dict:
+    """Construit le dict d'un salon à partir d'une ligne de _REQUETE_SALONS_STATS."""
+    salon_id = row[0]
+    return {
+        'salon_id': salon_id,
+        'nom_salon': row[1] or f"Salon {salon_id}",
+        'quartier': row[2] or '',
+        'responsable': row[3] or '',
+        'telephone': row[4] or '',
+        'email': row[5] or '',
+        'code_admin': row[6] or '',
+        'actif': row[7],
+        'date_creation': row[8],
+        'admin_nom': row[19],
+        'admin_prenom': row[20],
+        'nb_employes': int(row[15]),
+        'nb_clients': int(row[16]),
+        'nb_commandes': int(row[17]),
+        'ca_total': float(row[18]),
+        # Infos SMTP (pour debug / future UI)
+        'smtp_host': row[9],
+        'smtp_port': row[10],
+        'smtp_user': row[11],
+        'smtp_from': row[12],
+        'smtp_use_tls': row[13],
+        'smtp_use_ssl': row[14],
+    }
+
 
 class SalonModel:
-    """Modèle pour la gestion des salons de couture"""
+    """
+    Modèle pour la gestion des salons de couture
+    
+    Index supposés par les requêtes (database_schema.sql / database_migrations.sql) :
+        - couturiers(salon_id, role) : nombre d'employés et admin du salon
+        - clients(salon_id) : nombre de clients
+        - commandes(salon_id) INCLUDE (prix_total) : nombre de commandes et CA
+    """
+    
+    # Caches partagés par le processus (clé : salon_id, durée de vie 60 s ;
+    # (salon_id, avec_admin) pour les salons).
+    # Vidés par invalider_cache après chaque écriture (salon, admin, rôle) ;
+    # les écritures d'un autre processus sont visibles au plus tard à l'expiration.
+    _cache_lock = threading.Lock()
+    _salon_cache = TTLCache(maxsize=256, ttl=60)
+    _email_cfg_cache = TTLCache(maxsize=256, ttl=60)
     
     def __init__(self, db_connection):
         """
@@ -25,6 +150,55 @@ class SalonModel:
             db_connection: Instance de DatabaseConnection
         """
         self.db = db_connection
+        # Type de base fixé à la création de la connexion ('mysql' / 'postgresql')
+        self._db_type = db_connection.db_type
+    
+    @classmethod
+    def invalider_cache(cls):
+        """Vide les caches salon et config email (à appeler après toute écriture sur un salon ou son admin)."""
+        with cls._cache_lock:
+            cls._salon_cache.clear()
+            cls._email_cfg_cache.clear()
+    
+    def _verifier_table_salons(self) -> bool:
+        """
+        Vérifie (une fois par DatabaseConnection) que la table salons existe
+        
+        Returns:
+            False si la table est absente ; True sinon (y compris si la
+            vérification elle-même échoue, pour ne rien masquer)
+        """
+        presente = _TABLE_SALONS_PRESENTE.get(self.db)
+        if presente is not None:
+            return presente
+        try:
+            with self.db.cursor(lecture_seule=True) as (cursor, conn):
+                if self._db_type == 'mysql':
+                    cursor.execute("SHOW TABLES LIKE 'salons'")
+                else:  # PostgreSQL
+                    cursor.execute("""
+                        SELECT table_name 
+                        FROM information_schema.tables 
+                        WHERE table_schema = 'public' AND table_name = 'salons'
+                    """)
+                presente = cursor.fetchone() is not None
+        except (MySQLError, PGError, Exception) as e:
+            logger.warning("Erreur vérification table salons : %s", e)
+            return True
+        if not presente:
+            logger.error("La table 'salons' n'existe pas dans la base de données")
+        _TABLE_SALONS_PRESENTE[self.db] = presente
+        return presente
+    
+    def _exec_prepared(self, cursor, nom: str, sql: str, params=(), conn=None):
+        """
+        Exécute une requête de lecture fréquente en instruction préparée
+        (préparée une fois par connexion, cf. DatabaseConnection.execute_prepared)
+        
+        Returns:
+            Curseur à lire (en MySQL, curseur préparé mis en cache : ne pas le fermer)
+        """
+        return self.db.execute_prepared(cursor, nom, sql, params, conn=conn)
     
     def creer_salon_avec_admin(
         self,
@@ -49,7 +223,8 @@ class SalonModel:
     ) -> Optional[Dict]:
         """
         Crée un nouveau salon avec son administrateur
-        Utilise la procédure stockée creer_nouveau_salon
+        Utilise la procédure stockée creer_nouveau_salon (MySQL)
+        ou la fonction creer_nouveau_salon_pg (PostgreSQL)
         
         Args:
             nom_salon: Nom commercial du salon
@@ -95,58 +270,34 @@ class SalonModel:
             )
         
         try:
-            cursor = self.db.get_connection().cursor()
-            
             # Appeler la procédure stockée (MySQL uniquement)
             # PostgreSQL utilise une syntaxe différente, donc on passe directement au fallback
-            if self.db.db_type == 'mysql':
-                cursor.callproc('creer_nouveau_salon', [
-                    nom_salon, quartier, responsable, telephone, email,
-                    code_admin, password_admin, nom_admin, prenom_admin
-                ])
-                
-                # Récupérer le résultat
-                has_result = False
-                for result in cursor.stored_results():
-                    row = result.fetchone()
-                    if row:
-                        has_result = True
-                        self.db.get_connection().commit()
-                        cursor.close()
-                        return {
-                            'salon_id': row[0],
-                            'nom_salon': row[2],
-                            'code_admin': row[3],
-                            'message': row[4]
-                        }
+            if self._db_type == 'mysql':
+                row = None
+                with self.db.cursor() as (cursor, conn):
+                    cursor.callproc('creer_nouveau_salon', [
+                        nom_salon, quartier, responsable, telephone, email,
+                        code_admin, password_admin, nom_admin, prenom_admin
+                    ])
+                    
+                    # Récupérer le résultat
+                    for result in cursor.stored_results():
+                        row = result.fetchone()
+                        if row:
+                            conn.commit()
+                            break
                 
-                cursor.close()
+                if row:
+                    self.invalider_cache()
+                    return {
+                        'salon_id': row[0],
+                        'nom_salon': row[2],
+                        'code_admin': row[3],
+                        'message': row[4]
+                    }
                 
                 # Si la procédure n'a rien renvoyé, on bascule sur la méthode manuelle
-                if not has_result:
-                    print("⚠️ Procédure creer_nouveau_salon n'a retourné aucun résultat, fallback manuel.")
-                    return self.creer_salon_manuel(
-                        nom_salon,
-                        quartier,
-                        responsable,
-                        telephone,
-                        email,
-                        code_admin,
-                        password_admin,
-                        nom_admin,
-                        prenom_admin,
-                        smtp_host=smtp_host,
-                        smtp_port=smtp_port,
-                        smtp_user=smtp_user,
-                        smtp_password=smtp_password,
-                        smtp_from=smtp_from,
-                        smtp_use_tls=smtp_use_tls,
-                        smtp_use_ssl=smtp_use_ssl,
-                    )
-            else:
-                # PostgreSQL : passer directement à la méthode manuelle
-                cursor.close()
-                print("ℹ️ PostgreSQL détecté, utilisation de la méthode manuelle (pas de procédure stockée)")
+                logger.warning("Procédure creer_nouveau_salon n'a retourné aucun résultat, fallback manuel.")
                 return self.creer_salon_manuel(
                     nom_salon,
                     quartier,
@@ -165,12 +316,45 @@ class SalonModel:
                     smtp_use_tls=smtp_use_tls,
                     smtp_use_ssl=smtp_use_ssl,
                 )
-            
-            return None
+            else:
+                # PostgreSQL : fonction creer_nouveau_salon_pg (ID + salon + admin en un appel)
+                with self.db.cursor() as (cursor, conn):
+                    cursor.execute(
+                        "SELECT nouveau_salon_id, nouveau_admin_id FROM creer_nouveau_salon_pg("
+                        "%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)",
+                        (
+                            nom_salon, quartier, responsable, telephone, email,
+                            code_admin, password_admin, nom_admin, prenom_admin,
+                            smtp_host or None,
+                            int(smtp_port) if smtp_port is not None else None,
+                            smtp_user or None, smtp_password or None, smtp_from or None,
+                            smtp_use_tls, smtp_use_ssl,
+                        ),
+                    )
+                    row = cursor.fetchone()
+                    conn.commit()
+                invalider_cache_couturiers()
+                self.invalider_cache()
+                
+                return {
+                    'success': True,
+                    'salon_id': row[0],
+                    'nom_salon': nom_salon,
+                    'code_admin': code_admin,
+                    'message': 'Salon créé avec succès !'
+                }
             
         except Exception as e:
-            print(f"Erreur création salon (procédure) : {e}")
-            # Fallback : méthode manuelle si la procédure n'existe pas
+            # Rollback déjà effectué en sortie du bloc with. Fallback manuel
+            # seulement si la procédure/fonction n'existe pas : sinon (contrainte,
+            # doublon, échec partiel) un nouvel essai masquerait l'erreur réelle
+            if not _routine_absente(e):
+                logger.warning("Erreur création salon (procédure) : %s", e)
+                return {
+                    'success': False,
+                    'message': f"Erreur création salon : {e}"
+                }
+            logger.warning("Procédure de création de salon absente, fallback manuel : %s", e)
             return self.creer_salon_manuel(
                 nom_salon,
                 quartier,
@@ -215,39 +399,17 @@ class SalonModel:
         Méthode de fallback si la procédure stockée ne fonctionne pas
         """
         try:
-            conn = self.db.get_connection()
-            cursor = conn.cursor()
+            with self.db.cursor() as (cursor, conn):
             
-            # ÉTAPE 0 : Générer le prochain salon_id (format Jaind_000, Jaind_001, ...)
-            salon_id = salon_id_force
-            if not salon_id:
-                query_gen_id = "SELECT generer_prochain_salon_id() AS nouveau_id"
-                cursor.execute(query_gen_id)
-                result = cursor.fetchone()
-                salon_id = result[0] if result and result[0] else "Jaind_000"
-            
-            # Préparer la configuration SMTP (avec valeurs par défaut si non fournies)
-            smtp_host_final = smtp_host or "smtp.gmail.com"
-            smtp_port_final = int(smtp_port) if smtp_port is not None else 587
-            smtp_user_final = smtp_user or None
-            smtp_password_final = smtp_password or None
-            smtp_from_final = smtp_from or smtp_user_final
-            smtp_use_tls_final = smtp_use_tls if smtp_use_tls is not None else True
-            smtp_use_ssl_final = smtp_use_ssl if smtp_use_ssl is not None else False
-
-            # ÉTAPE 1 : Créer le salon avec l'ID personnalisé
-            query_salon = """
-                INSERT INTO salons (
-                    salon_id, nom, quartier, responsable, telephone, email,
-                    code_admin, smtp_host, smtp_port, smtp_user, smtp_password,
-                    smtp_from, smtp_use_tls, smtp_use_ssl
-                )
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            """
-            cursor.execute(
-                query_salon,
-                (
-                    salon_id,
+                # Préparer la configuration SMTP (avec valeurs par défaut si non fournies)
+                smtp_host_final = smtp_host or "smtp.gmail.com"
+                smtp_port_final = int(smtp_port) if smtp_port is not None else 587
+                smtp_user_final = smtp_user or None
+                smtp_password_final = smtp_password or None
+                smtp_from_final = smtp_from or smtp_user_final
+                smtp_use_tls_final = smtp_use_tls if smtp_use_tls is not None else True
+                smtp_use_ssl_final = smtp_use_ssl if smtp_use_ssl is not None else False
+                valeurs_salon = (
                     nom_salon,
                     quartier,
                     responsable,
@@ -261,24 +423,64 @@ class SalonModel:
                     smtp_from_final,
                     smtp_use_tls_final,
                     smtp_use_ssl_final,
-                ),
-            )
-            
-            # ÉTAPE 2 : Créer l'admin (salon_id est VARCHAR)
-            query_admin = """
-                INSERT INTO couturiers (code_couturier, password, nom, prenom, role, salon_id, email, telephone)
-                VALUES (%s, %s, %s, %s, 'admin', %s, %s, %s)
-            """
-            if self.db.db_type == 'mysql':
-                cursor.execute(query_admin, (code_admin, password_admin, nom_admin, prenom_admin, salon_id, email, telephone))
-                admin_id = cursor.lastrowid
-            else:  # PostgreSQL
-                query_admin += " RETURNING id"
-                cursor.execute(query_admin, (code_admin, password_admin, nom_admin, prenom_admin, salon_id, email, telephone))
-                admin_id = cursor.fetchone()[0]
-            
-            conn.commit()
-            cursor.close()
+                )
+                valeurs_admin = (code_admin, password_admin, nom_admin, prenom_admin, email, telephone)
+                
+                if self._db_type == 'postgresql':
+                    # Un seul aller-retour : génération de l'ID, salon et admin (CTE)
+                    query_creation = """
+                        WITH new_salon AS (
+                            INSERT INTO salons (
+                                salon_id, nom, quartier, responsable, telephone, email,
+                                code_admin, smtp_host, smtp_port, smtp_user, smtp_password,
+                                smtp_from, smtp_use_tls, smtp_use_ssl
+                            )
+                            VALUES (
+                                COALESCE(%s, generer_prochain_salon_id(), 'Jaind_000'),
+                                %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
+                            )
+                            RETURNING salon_id
+                        ), new_admin AS (
+                            INSERT INTO couturiers (code_couturier, password, nom, prenom, role, salon_id, email, telephone)
+                            SELECT %s, %s, %s, %s, 'admin', salon_id, %s, %s FROM new_salon
+                            RETURNING id
+                        )
+                        SELECT s.salon_id, a.id FROM new_salon s, new_admin a
+                    """
+                    cursor.execute(query_creation, (salon_id_force or None, *valeurs_salon, *valeurs_admin))
+                    salon_id, admin_id = cursor.fetchone()
+                else:
+                    # ÉTAPE 0 : Générer le prochain salon_id (format Jaind_000, Jaind_001, ...)
+                    salon_id = salon_id_force
+                    if not salon_id:
+                        query_gen_id = "SELECT generer_prochain_salon_id() AS nouveau_id"
+                        cursor.execute(query_gen_id)
+                        result = cursor.fetchone()
+                        salon_id = result[0] if result and result[0] else "Jaind_000"
+                    
+                    # ÉTAPE 1 : Créer le salon avec l'ID personnalisé
+                    query_salon = """
+                        INSERT INTO salons (
+                            salon_id, nom, quartier, responsable, telephone, email,
+                            code_admin, smtp_host, smtp_port, smtp_user, smtp_password,
+                            smtp_from, smtp_use_tls, smtp_use_ssl
+                        )
+                        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                    """
+                    cursor.execute(query_salon, (salon_id, *valeurs_salon))
+                    
+                    # ÉTAPE 2 : Créer l'admin (salon_id est VARCHAR)
+                    query_admin = """
+                        INSERT INTO couturiers (code_couturier, password, nom, prenom, role, salon_id, email, telephone)
+                        VALUES (%s, %s, %s, %s, 'admin', %s, %s, %s)
+                    """
+                    admin_id = self.db.insert_returning_id(
+                        cursor, query_admin, (*valeurs_admin[:4], salon_id, *valeurs_admin[4:])
+                    )
+                
+                conn.commit()
+            invalider_cache_couturiers()
+            self.invalider_cache()
             
             return {
                 'success': True,
@@ -289,11 +491,8 @@ class SalonModel:
             }
             
         except (MySQLError, PGError, Exception) as e:
-            print(f"Erreur création salon manuelle : {e}")
-            try:
-                conn.rollback()
-            except:
-                pass
+            # Rollback déjà effectué en sortie du bloc with
+            logger.warning("Erreur création salon manuelle : %s", e)
             return {
                 'success': False,
                 'message': f"Erreur création salon : {e}"
@@ -306,15 +505,37 @@ class SalonModel:
         Retourne None en cas d'erreur.
         """
         try:
-            cursor = self.db.get_connection().cursor()
-            cursor.execute("SELECT generer_prochain_salon_id() AS id")
-            res = cursor.fetchone()
-            cursor.close()
-            return res[0] if res and res[0] else "Jaind_000"
+            with self.db.cursor(lecture_seule=True) as (cursor, conn):
+                cursor.execute("SELECT generer_prochain_salon_id() AS id")
+                res = cursor.fetchone()
+                return res[0] if res and res[0] else "Jaind_000"
         except Exception as e:
-            print(f"Erreur prévisualisation salon_id : {e}")
+            logger.warning("Erreur prévisualisation salon_id : %s", e)
             return None
     
+    def iter_salons(self) -> Iterator[Dict]:
+        """
+        Parcourt tous les salons avec leurs statistiques, un par un
+        (curseur côté serveur en PostgreSQL : les lignes arrivent par lots)
+        Pour SUPER_ADMIN uniquement
+        
+        Yields:
+            Dict d'un salon avec statistiques
+        """
+        # Présence de la table salons : vérifiée une seule fois par connexion,
+        # au premier listage plutôt qu'à la construction du modèle
+        if not self._verifier_table_salons():
+            return
+        
+        # Curseur nommé = curseur serveur (nécessite une transaction : pas de lecture_seule)
+        options = {'name': 'salons_stream'} if self._db_type == 'postgresql' else {}
+        with self.db.cursor(**options) as (cursor, conn):
+            if options:
+                cursor.itersize = 2000
+            cursor.execute(_REQUETE_SALONS_STATS)
+            for row in cursor:
+                yield _salon_depuis_ligne(row)
+    
     def lister_tous_salons(self) -> List[Dict]:
         """
         Liste tous les salons avec leurs statistiques
@@ -324,159 +545,9 @@ class SalonModel:
             Liste des salons avec statistiques
         """
         try:
-            cursor = self.db.get_connection().cursor()
-            
-            # D'abord, vérifier si la table salons existe et sa structure
-            # Essayer une requête simple d'abord
-            try:
-                simple_query = """
-                    SELECT salon_id,
-                           nom,
-                           quartier,
-                           responsable,
-                           telephone,
-                           email,
-                           code_admin,
-                           actif,
-                           date_creation,
-                           smtp_host,
-                           smtp_port,
-                           smtp_user,
-                           smtp_from,
-                           smtp_use_tls,
-                           smtp_use_ssl
-                    FROM salons
-                    ORDER BY salon_id
-                """
-                cursor.execute(simple_query)
-                results = cursor.fetchall()
-                
-                if not results:
-                    print("⚠️ Table 'salons' existe mais est vide")
-                    cursor.close()
-                    return []
-                
-                # Si on a des résultats, construire la liste avec les données de base
-                salons = []
-                for row in results:
-                    salon_id = row[0]
-                    
-                    # Récupérer les statistiques pour chaque salon
-                    try:
-                        # Nombre d'employés
-                        cursor.execute(
-                            "SELECT COUNT(*) FROM couturiers WHERE salon_id = %s AND role = 'employe'",
-                            (salon_id,)
-                        )
-                        nb_employes = cursor.fetchone()[0] or 0
-                    except:
-                        nb_employes = 0
-                    
-                    try:
-                        # Nombre de clients
-                        cursor.execute(
-                            "SELECT COUNT(*) FROM clients WHERE salon_id = %s",
-                            (salon_id,)
-                        )
-                        nb_clients = cursor.fetchone()[0] or 0
-                    except:
-                        nb_clients = 0
-                    
-                    try:
-                        # Nombre de commandes
-                        cursor.execute(
-                            "SELECT COUNT(*) FROM commandes WHERE salon_id = %s",
-                            (salon_id,)
-                        )
-                        nb_commandes = cursor.fetchone()[0] or 0
-                    except:
-                        nb_commandes = 0
-                    
-                    # Calculer le CA total
-                    try:
-                        cursor.execute(
-                            "SELECT COALESCE(SUM(prix_total), 0) FROM commandes WHERE salon_id = %s",
-                            (salon_id,)
-                        )
-                        ca_total = float(cursor.fetchone()[0] or 0)
-                    except:
-                        ca_total = 0.0
-                    
-                    # Récupérer l'admin du salon
-                    try:
-                        cursor.execute(
-                            "SELECT nom, prenom FROM couturiers WHERE salon_id = %s AND role = 'admin' LIMIT 1",
-                            (salon_id,)
-                        )
-                        admin_row = cursor.fetchone()
-                        admin_nom = admin_row[0] if admin_row else None
-                        admin_prenom = admin_row[1] if admin_row and len(admin_row) > 1 else None
-                    except:
-                        admin_nom = None
-                        admin_prenom = None
-                    
-                    salons.append({
-                        'salon_id': salon_id,
-                        'nom_salon': row[1] if len(row) > 1 and row[1] else f"Salon {salon_id}",
-                        'quartier': row[2] if len(row) > 2 and row[2] else '',
-                        'responsable': row[3] if len(row) > 3 and row[3] else '',
-                        'telephone': row[4] if len(row) > 4 and row[4] else '',
-                        'email': row[5] if len(row) > 5 and row[5] else '',
-                        'code_admin': row[6] if len(row) > 6 and row[6] else '',
-                        'actif': row[7] if len(row) > 7 else True,
-                        'date_creation': row[8] if len(row) > 8 else None,
-                        'admin_nom': admin_nom,
-                        'admin_prenom': admin_prenom,
-                        'nb_employes': int(nb_employes),
-                        'nb_clients': int(nb_clients),
-                        'nb_commandes': int(nb_commandes),
-                        'ca_total': ca_total,
-                        # Infos SMTP (pour debug / future UI)
-                        'smtp_host': row[9] if len(row) > 9 else None,
-                        'smtp_port': row[10] if len(row) > 10 else None,
-                        'smtp_user': row[11] if len(row) > 11 else None,
-                        'smtp_from': row[12] if len(row) > 12 else None,
-                        'smtp_use_tls': row[13] if len(row) > 13 else None,
-                        'smtp_use_ssl': row[14] if len(row) > 14 else None,
-                    })
-                
-                cursor.close()
-                return salons
-                
-            except Exception as e_simple:
-                print(f"Erreur requête simple salons: {e_simple}")
-                # Essayer de vérifier si la table existe
-                try:
-                    if self.db.db_type == 'mysql':
-                        cursor.execute("SHOW TABLES LIKE 'salons'")
-                    else:  # PostgreSQL
-                        cursor.execute("""
-                            SELECT table_name 
-                            FROM information_schema.tables 
-                            WHERE table_schema = 'public' AND table_name = 'salons'
-                        """)
-                    table_exists = cursor.fetchone()
-                    cursor.close()
-                    
-                    if not table_exists:
-                        print("❌ La table 'salons' n'existe pas dans la base de données")
-                        return []
-                    else:
-                        print("⚠️ La table 'salons' existe mais la requête a échoué")
-                        return []
-                except Exception as e_check:
-                    print(f"Erreur vérification table: {e_check}")
-                    cursor.close()
-                    return []
-            
-        except (MySQLError, PGError, Exception) as e:
-            print(f"Erreur liste salons : {e}")
-            import traceback
-            traceback.print_exc()
-            try:
-                cursor.close()
-            except:
-                pass
+            return list(self.iter_salons())
+        except (MySQLError, PGError) as e:
+            logger.exception("Erreur liste salons : %s", e)
             return []
     
     def obtenir_salon_by_code_admin(self, code_admin: str) -> Optional[Dict]:
@@ -491,48 +562,46 @@ class SalonModel:
             Dict avec les infos du salon ou None
         """
         try:
-            cursor = self.db.get_connection().cursor()
-            query = """
-                SELECT 
-                    s.salon_id AS salon_id,
-                    s.nom AS nom_salon,
-                    s.quartier,
-                    s.responsable,
-                    s.telephone,
-                    s.code_admin,
-                    c.id AS admin_id,
-                    c.nom AS admin_nom,
-                    c.prenom AS admin_prenom
-                FROM salons s
-                LEFT JOIN couturiers c 
-                    ON c.salon_id = s.salon_id AND c.role = 'admin'
-                WHERE s.code_admin = %s
-            """
-            cursor.execute(query, (code_admin,))
-            row = cursor.fetchone()
-            cursor.close()
+            with self.db.cursor(lecture_seule=True) as (cursor, conn):
+                query = """
+                    SELECT 
+                        s.salon_id AS salon_id,
+                        s.nom AS nom_salon,
+                        s.quartier,
+                        s.responsable,
+                        s.telephone,
+                        s.code_admin,
+                        c.id AS admin_id,
+                        c.nom AS admin_nom,
+                        c.prenom AS admin_prenom
+                    FROM salons s
+                    LEFT JOIN couturiers c 
+                        ON c.salon_id = s.salon_id AND c.role = 'admin'
+                    WHERE s.code_admin = %s
+                """
+                row = self._exec_prepared(cursor, 'salon_by_code_admin', query, (code_admin,), conn=conn).fetchone()
             
-            if row:
-                return {
-                    'salon_id': row[0],
-                    'nom_salon': row[1],
-                    'quartier': row[2],
-                    'responsable': row[3],
-                    'telephone': row[4],
-                    'code_admin': row[5],
-                    'admin_id': row[6],
-                    'admin_nom': row[7],
-                    'admin_prenom': row[8]
-                }
-            return None
+                if row:
+                    return {
+                        'salon_id': row[0],
+                        'nom_salon': row[1],
+                        'quartier': row[2],
+                        'responsable': row[3],
+                        'telephone': row[4],
+                        'code_admin': row[5],
+                        'admin_id': row[6],
+                        'admin_nom': row[7],
+                        'admin_prenom': row[8]
+                    }
+                return None
             
         except (MySQLError, PGError, Exception) as e:
-            print(f"Erreur recherche salon : {e}")
+            logger.warning("Erreur recherche salon : %s", e)
             return None
     
     def obtenir_salon_by_id(self, salon_id: str) -> Optional[Dict]:
         """
-        Récupère un salon par son ID
+        Récupère un salon par son ID (avec le nom de son admin)
         
         Args:
             salon_id: ID du salon
@@ -540,74 +609,100 @@ class SalonModel:
         Returns:
             Dict avec les infos du salon ou None
         """
+        return self.obtenir_salon_avec_admin(salon_id)
+    
+    def obtenir_salon_avec_admin(self, salon_id: str) -> Optional[Dict]:
+        """Récupère un salon avec admin_nom / admin_prenom (jointure couturiers)."""
+        return self._obtenir_salon(salon_id, avec_admin=True)
+    
+    def obtenir_salon_sans_admin(self, salon_id: str) -> Optional[Dict]:
+        """Récupère un salon sans les infos de son admin (aucune jointure)."""
+        return self._obtenir_salon(salon_id, avec_admin=False)
+    
+    def _obtenir_salon(self, salon_id: str, avec_admin: bool) -> Optional[Dict]:
+        """
+        Lecture (mise en cache) d'un salon ; la jointure sur l'admin n'est
+        faite que si avec_admin est vrai
+        """
+        cle = (salon_id, avec_admin)
+        with self._cache_lock:
+            salon = self._salon_cache.get(cle)
+        if salon is not None:
+            return dict(salon)
+        
         try:
-            cursor = self.db.get_connection().cursor()
-            query = """
-                SELECT 
-                    s.salon_id,
-                    s.nom,
-                    s.quartier,
-                    s.responsable,
-                    s.telephone,
-                    s.email,
-                    s.code_admin,
-                    s.actif,
-                    s.date_creation,
-                    c.nom AS admin_nom,
-                    c.prenom AS admin_prenom,
-                    s.smtp_host,
-                    s.smtp_port,
-                    s.smtp_user,
-                    s.smtp_password,
-                    s.smtp_from,
-                    s.smtp_use_tls,
-                    s.smtp_use_ssl
-                FROM salons s
-                LEFT JOIN (
-                    SELECT salon_id, nom, prenom
-                    FROM couturiers
-                    WHERE role = 'admin'
-                ) c ON c.salon_id = s.salon_id
-                WHERE s.salon_id = %s
-            """
-            cursor.execute(query, (salon_id,))
-            row = cursor.fetchone()
-            cursor.close()
+            with self.db.cursor(lecture_seule=True) as (cursor, conn):
+                if avec_admin:
+                    query = f"""
+                        SELECT {_COLONNES_SALON}, c.nom AS admin_nom, c.prenom AS admin_prenom
+                        FROM salons s
+                        LEFT JOIN (
+                            SELECT salon_id, nom, prenom
+                            FROM couturiers
+                            WHERE role = 'admin'
+                        ) c ON c.salon_id = s.salon_id
+                        WHERE s.salon_id = %s
+                    """
+                    nom_requete = 'salon_by_id'
+                else:
+                    query = f"SELECT {_COLONNES_SALON} FROM salons s WHERE s.salon_id = %s"
+                    nom_requete = 'salon_by_id_sans_admin'
+                row = self._exec_prepared(cursor, nom_requete, query, (salon_id,), conn=conn).fetchone()
             
             if row:
-                return {
-                    'salon_id': row[0],
-                    'nom_salon': row[1],
-                    'quartier': row[2],
-                    'responsable': row[3],
-                    'telephone': row[4],
-                    'email': row[5],
-                    'code_admin': row[6],
-                    'actif': row[7],
-                    'date_creation': row[8],
-                    'admin_nom': row[9],
-                    'admin_prenom': row[10],
-                    'smtp_host': row[11],
-                    'smtp_port': row[12],
-                    'smtp_user': row[13],
-                    'smtp_password': row[14],
-                    'smtp_from': row[15],
-                    'smtp_use_tls': row[16],
-                    'smtp_use_ssl': row[17],
-                }
+                salon = dict(zip(_CLES_SALON, row))
+                if avec_admin:
+                    salon['admin_nom'], salon['admin_prenom'] = row[len(_CLES_SALON):]
+                with self._cache_lock:
+                    self._salon_cache[cle] = salon
+                return dict(salon)
             return None
             
         except (MySQLError, PGError, Exception) as e:
-            print(f"Erreur récupération salon : {e}")
+            logger.warning("Erreur récupération salon : %s", e)
             return None
 
+    def _obtenir_smtp_by_id(self, salon_id: str) -> Optional[Dict]:
+        """
+        Récupère uniquement les colonnes SMTP d'un salon (sans jointure)
+        
+        Returns:
+            Dict smtp_* ou None si salon introuvable
+        """
+        with self.db.cursor(lecture_seule=True) as (cursor, conn):
+            query = """
+                SELECT smtp_host, smtp_port, smtp_user, smtp_password,
+                       smtp_from, smtp_use_tls, smtp_use_ssl
+                FROM salons
+                WHERE salon_id = %s
+            """
+            row = self._exec_prepared(cursor, 'salon_smtp_by_id', query, (salon_id,), conn=conn).fetchone()
+        
+        if row:
+            return {
+                'smtp_host': row[0],
+                'smtp_port': row[1],
+                'smtp_user': row[2],
+                'smtp_password': row[3],
+                'smtp_from': row[4],
+                'smtp_use_tls': row[5],
+                'smtp_use_ssl': row[6],
+            }
+        return None
+
     def obtenir_config_email_salon(self, salon_id: str) -> Optional[Dict]:
         """
         Récupère la configuration SMTP d'un salon pour l'envoi d'e-mails.
         Retourne un dict compatible avec EmailController ou None si non configuré.
         """
+        # None en cache = salon sans configuration SMTP ; False = absent du cache
+        with self._cache_lock:
+            config = self._email_cfg_cache.get(salon_id, False)
+        if config is not False:
+            return dict(config) if config else None
+        
         try:
-            salon = self.obtenir_salon_by_id(salon_id)
+            salon = self._obtenir_smtp_by_id(salon_id)
             if not salon:
                 return None
 
@@ -615,35 +710,39 @@ class SalonModel:
             smtp_password = salon.get("smtp_password")
 
             # Si pas d'utilisateur ou mot de passe SMTP, on considère que la config n'est pas prête
-            if not smtp_user or not smtp_password:
-                return None
-
-            return {
-                "enabled": True,
-                "host": salon.get("smtp_host") or "smtp.gmail.com",
-                "port": int(salon.get("smtp_port") or 587),
-                "user": smtp_user,
-                "password": smtp_password,
-                "from_email": salon.get("smtp_from") or smtp_user,
-                "use_tls": salon.get("smtp_use_tls") if salon.get("smtp_use_tls") is not None else True,
-                "use_ssl": salon.get("smtp_use_ssl") if salon.get("smtp_use_ssl") is not None else False,
-            }
+            config = None
+            if smtp_user and smtp_password:
+                config = {
+                    "enabled": True,
+                    "host": salon.get("smtp_host") or "smtp.gmail.com",
+                    "port": int(salon.get("smtp_port") or 587),
+                    "user": smtp_user,
+                    "password": smtp_password,
+                    "from_email": salon.get("smtp_from") or smtp_user,
+                    "use_tls": salon.get("smtp_use_tls") if salon.get("smtp_use_tls") is not None else True,
+                    "use_ssl": salon.get("smtp_use_ssl") if salon.get("smtp_use_ssl") is not None else False,
+                }
+            
+            with self._cache_lock:
+                self._email_cfg_cache[salon_id] = config
+            return dict(config) if config else None
         except Exception as e:
-            print(f"Erreur récupération config email salon: {e}")
+            logger.warning("Erreur récupération config email salon: %s", e)
             return None
     
-    def modifier_salon(self, salon_id: str, nom: str = None, quartier: str = None,
-                       responsable: str = None, telephone: str = None,
-                       email: str = None, actif: bool = None,
-                       smtp_host: Optional[str] = None,
-                       smtp_port: Optional[int] = None,
-                       smtp_user: Optional[str] = None,
-                       smtp_password: Optional[str] = None,
-                       smtp_from: Optional[str] = None,
-                       smtp_use_tls: Optional[bool] = None,
-                       smtp_use_ssl: Optional[bool] = None) -> bool:
+    def modifier_salon(self, salon_id: str, nom=_INCHANGE, quartier=_INCHANGE,
+                       responsable=_INCHANGE, telephone=_INCHANGE,
+                       email=_INCHANGE, actif=_INCHANGE,
+                       smtp_host=_INCHANGE,
+                       smtp_port=_INCHANGE,
+                       smtp_user=_INCHANGE,
+                       smtp_password=_INCHANGE,
+                       smtp_from=_INCHANGE,
+                       smtp_use_tls=_INCHANGE,
+                       smtp_use_ssl=_INCHANGE) -> bool:
         """
-        Modifie les informations d'un salon
+        Modifie les informations d'un salon.
+        Seuls les champs passés sont mis à jour ; passer None vide le champ.
         
         Args:
             salon_id: ID du salon à modifier
@@ -653,82 +752,46 @@ class SalonModel:
             telephone: Nouveau téléphone (optionnel)
             email: Nouvel email (optionnel)
             actif: Nouveau statut actif/inactif (optionnel)
+            smtp_*: Nouveaux paramètres SMTP (optionnels)
             
         Returns:
             True si succès, False sinon
         """
         try:
-            conn = self.db.get_connection()
-            cursor = conn.cursor()
-            
-            # Construire la requête UPDATE dynamiquement
-            updates = []
-            params = []
+            with self.db.cursor() as (cursor, conn):
             
-            if nom is not None:
-                updates.append("nom = %s")
-                params.append(nom)
-            if quartier is not None:
-                updates.append("quartier = %s")
-                params.append(quartier)
-            if responsable is not None:
-                updates.append("responsable = %s")
-                params.append(responsable)
-            if telephone is not None:
-                updates.append("telephone = %s")
-                params.append(telephone)
-            if email is not None:
-                updates.append("email = %s")
-                params.append(email)
-            if actif is not None:
-                updates.append("actif = %s")
-                params.append(actif)
-            if smtp_host is not None:
-                updates.append("smtp_host = %s")
-                params.append(smtp_host)
-            if smtp_port is not None:
-                updates.append("smtp_port = %s")
-                params.append(smtp_port)
-            if smtp_user is not None:
-                updates.append("smtp_user = %s")
-                params.append(smtp_user)
-            if smtp_password is not None:
-                updates.append("smtp_password = %s")
-                params.append(smtp_password)
-            if smtp_from is not None:
-                updates.append("smtp_from = %s")
-                params.append(smtp_from)
-            if smtp_use_tls is not None:
-                updates.append("smtp_use_tls = %s")
-                params.append(smtp_use_tls)
-            if smtp_use_ssl is not None:
-                updates.append("smtp_use_ssl = %s")
-                params.append(smtp_use_ssl)
+                # Construire la requête UPDATE avec les seuls champs fournis
+                champs = {
+                    'nom': nom, 'quartier': quartier, 'responsable': responsable,
+                    'telephone': telephone, 'email': email, 'actif': actif,
+                    'smtp_host': smtp_host, 'smtp_port': smtp_port, 'smtp_user': smtp_user,
+                    'smtp_password': smtp_password, 'smtp_from': smtp_from,
+                    'smtp_use_tls': smtp_use_tls, 'smtp_use_ssl': smtp_use_ssl,
+                }
+                fournis = {colonne: valeur for colonne, valeur in champs.items() if valeur is not _INCHANGE}
+                updates = [f"{colonne} = %s" for colonne in fournis]
+                params = list(fournis.values())
             
-            if not updates:
-                cursor.close()
-                return False  # Aucune modification demandée
+                if not updates:
+                    return False  # Aucune modification demandée
             
-            # Ajouter salon_id aux paramètres
-            params.append(salon_id)
+                # Ajouter salon_id aux paramètres
+                params.append(salon_id)
             
-            query = f"""
-                UPDATE salons
-                SET {', '.join(updates)}
-                WHERE salon_id = %s
-            """
+                query = f"""
+                    UPDATE salons
+                    SET {', '.join(updates)}
+                    WHERE salon_id = %s
+                """
             
-            cursor.execute(query, tuple(params))
-            conn.commit()
-            cursor.close()
+                cursor.execute(query, tuple(params))
+                conn.commit()
             
+            self.invalider_cache()
             return True
             
         except (MySQLError, PGError, Exception) as e:
-            print(f"Erreur modification salon : {e}")
-            try:
-                conn.rollback()
-            except:
-                pass
+            # Rollback déjà effectué en sortie du bloc with
+            logger.warning("Erreur modification salon : %s", e)
             return False
 
@@ -3,8 +3,47 @@ Module d'optimisation d'images pour réduire leur taille avant insertion en base
 """
 
 import io
-from PIL import Image
-from typing import Optional, Tuple
+import logging
+
+import PIL
+from PIL import Image, ImageOps
+from typing import Optional, Tuple, Union
+
+try:
+    import mozjpeg_lossless_optimization as mozjpeg_opt
+except ImportError:  # dépendance optionnelle
+    mozjpeg_opt = None
+
+logger = logging.getLogger(__name__)
+
+# Exposant empirique de la relation taille JPEG / qualité (estimation avant encodage)
+_EXPOSANT_TAILLE_QUALITE = 1.3
+
+# Version de Pillow chargée (une build pillow-simd se reconnaît à son suffixe ".postN")
+logger.info("Pillow %s chargé pour l'optimisation d'images", PIL.__version__)
+
+
+def _encoder_jpeg(image: Image.Image, output: io.BytesIO, quality: int) -> None:
+    """
+    Encode l'image en JPEG progressif dans output (vidé au préalable).
+    
+    La position finale du flux est sa taille : output.tell() évite la copie
+    qu'implique len(output.getvalue()).
+    """
+    output.seek(0)
+    output.truncate(0)
+    image.save(output, format='JPEG', quality=quality, optimize=True, progressive=True)
+
+
+def _optimiser_mozjpeg(donnees: Union[bytes, memoryview]) -> bytes:
+    """
+    Recompresse sans perte le JPEG retenu avec mozjpeg si disponible
+    (tables de Huffman / scans progressifs) : -10 à -20 %.
+    """
+    donnees = bytes(donnees)
+    if mozjpeg_opt is None:
+        return donnees
+    return mozjpeg_opt.optimize(donnees)
 
 
 def optimiser_image(image_bytes: bytes, max_size: Tuple[int, int] = (1920, 1920), 
@@ -25,14 +64,36 @@ def optimiser_image(image_bytes: bytes, max_size: Tuple[int, int] = (1920, 1920)
         # Ouvrir l'image depuis les bytes
         image = Image.open(io.BytesIO(image_bytes))
         
+        # JPEG RGB déjà conforme (poids, dimensions) et sans métadonnées EXIF/ICC
+        # (que le ré-encodage supprimerait) : rendu tel quel.
+        # Seul l'en-tête a été lu, aucun pixel n'est décodé
+        if (image.format == 'JPEG' and image.mode == 'RGB'
+                and len(image_bytes) <= max_file_size_mb * 1024 * 1024
+                and image.width <= max_size[0] and image.height <= max_size[1]
+                and not image.info.get('exif') and not image.info.get('icc_profile')
+                and len(image.getexif()) == 0):
+            return image_bytes
+        
+        # JPEG : décoder directement à l'échelle 1/2, 1/4 ou 1/8 la plus proche
+        # (toujours ≥ max_size), le redimensionnement LANCZOS termine ensuite
+        if image.format == 'JPEG':
+            image.draft('RGB', max_size)
+        
+        # Appliquer l'orientation EXIF (photos de téléphone) avant le redimensionnement,
+        # sur place : aucune copie si l'orientation est déjà normale
+        ImageOps.exif_transpose(image, in_place=True)
+        
         # Convertir en RGB si nécessaire (pour JPEG)
         if image.mode in ('RGBA', 'LA', 'P'):
-            # Créer un fond blanc pour les images avec transparence
-            background = Image.new('RGB', image.size, (255, 255, 255))
-            if image.mode == 'P':
+            if image.mode != 'RGBA':
                 image = image.convert('RGBA')
-            background.paste(image, mask=image.split()[-1] if image.mode in ('RGBA', 'LA') else None)
-            image = background
+            # Extraire uniquement la bande alpha (split() copierait toutes les bandes)
+            if image.getchannel('A').getextrema()[0] < 255:
+                # Composer sur un fond blanc en une seule passe
+                background = Image.new('RGBA', image.size, (255, 255, 255, 255))
+                image = Image.alpha_composite(background, image)
+            # Entièrement opaque : conversion directe, sans fond
+            image = image.convert('RGB')
         elif image.mode != 'RGB':
             image = image.convert('RGB')
         
@@ -41,28 +102,43 @@ def optimiser_image(image_bytes: bytes, max_size: Tuple[int, int] = (1920, 1920)
         if original_size[0] > max_size[0] or original_size[1] > max_size[1]:
             image.thumbnail(max_size, Image.Resampling.LANCZOS)
         
-        # Optimiser la qualité jusqu'à atteindre la taille cible
+        # Encoder à la qualité demandée : suffit dans la plupart des cas
         output = io.BytesIO()
-        current_quality = quality
         min_quality = 60  # Qualité minimale acceptable
+        taille_max = max_file_size_mb * 1024 * 1024
+        
+        _encoder_jpeg(image, output, quality)
+        taille_ref = output.tell()
+        if taille_ref <= taille_max or quality <= min_quality:
+            return _optimiser_mozjpeg(output.getbuffer())
+        qualite_ref = quality
+        
+        # Recherche dichotomique de la plus haute qualité respectant la taille
+        # (la taille croît avec la qualité) : hi ne tient pas, lo reste à tester
+        lo, hi = min_quality, quality
+        meilleur = None
+        while hi - lo > 2:
+            mid = (lo + hi) // 2
+            # Estimation empirique depuis le dernier encodage : taille ∝ qualité^1.3.
+            # Inutile d'encoder si l'estimation dépasse nettement la cible
+            if taille_ref * (mid / qualite_ref) ** _EXPOSANT_TAILLE_QUALITE > taille_max * 1.15:
+                hi = mid
+                continue
+            _encoder_jpeg(image, output, mid)
+            qualite_ref, taille_ref = mid, output.tell()
+            if taille_ref <= taille_max:
+                lo = mid
+                meilleur = output.getvalue()
+            else:
+                hi = mid
         
-        while current_quality >= min_quality:
-            output.seek(0)
-            output.truncate(0)
-            
-            # Sauvegarder en JPEG avec la qualité actuelle
-            image.save(output, format='JPEG', quality=current_quality, optimize=True)
-            
-            # Vérifier la taille
-            file_size_mb = len(output.getvalue()) / (1024 * 1024)
-            
-            if file_size_mb <= max_file_size_mb:
-                break
-            
-            # Réduire la qualité si trop gros
-            current_quality -= 5
+        if meilleur is None:
+            # Aucune qualité intermédiaire ne tient : qualité minimale
+            _encoder_jpeg(image, output, min_quality)
+            meilleur = output.getvalue()
         
-        return output.getvalue()
+        # mozjpeg une seule fois, sur le résultat retenu par la dichotomie
+        return _optimiser_mozjpeg(meilleur)
         
     except Exception as e:
         print(f"Erreur optimisation image: {e}")
@@ -81,22 +157,23 @@ def obtenir_taille_image(image_bytes: bytes) -> Tuple[int, int]:
         Tuple (largeur, hauteur) en pixels
     """
     try:
-        image = Image.open(io.BytesIO(image_bytes))
-        return image.size
+        # Image.open est paresseux : seul l'en-tête est lu, les pixels ne sont pas décodés
+        with Image.open(io.BytesIO(image_bytes)) as image:
+            return image.size
     except Exception as e:
         print(f"Erreur lecture taille image: {e}")
         return (0, 0)
 
 
-def obtenir_taille_fichier_mb(image_bytes: bytes) -> float:
+def obtenir_taille_fichier_mb(image_bytes: Union[bytes, memoryview]) -> float:
     """
     Obtient la taille d'une image en MB.
     
     Args:
-        image_bytes: Image en bytes
+        image_bytes: Image en bytes, ou memoryview (ex. UploadedFile.getbuffer()) sans copie
         
     Returns:
         Taille en MB
     """
-    return len(image_bytes) / (1024 * 1024)
+    return memoryview(image_bytes).nbytes / (1024 * 1024)
 
@@ -2,9 +2,43 @@
 Utilitaires pour la gestion des permissions multi-salon
 """
 import streamlit as st
+from types import MappingProxyType
 from typing import Dict, Optional
 
 
+# Permissions statiques par rôle (lecture seule) ; role_display est complété
+# avec le salon dans obtenir_permissions_utilisateur
+_ROLE_PERMS = {
+    'SUPER_ADMIN': MappingProxyType({
+        'can_view_all_salons': True,
+        'can_create_salon': True,
+        'can_create_admin': True,
+        'can_create_employe': False,  # Le SUPER_ADMIN crée des admins, pas des employés
+        'can_switch_salon': True,
+        'can_manage_all_data': True,
+        'role_display': '👑 Super Administrateur'
+    }),
+    'admin': MappingProxyType({
+        'can_view_all_salons': False,
+        'can_create_salon': False,
+        'can_create_admin': False,
+        'can_create_employe': True,
+        'can_switch_salon': False,
+        'can_manage_all_data': False,
+        'role_display': '🏢 Administrateur (Salon {salon_id})'
+    }),
+    'employe': MappingProxyType({
+        'can_view_all_salons': False,
+        'can_create_salon': False,
+        'can_create_admin': False,
+        'can_create_employe': False,
+        'can_switch_salon': False,
+        'can_manage_all_data': False,
+        'role_display': '👤 Employé (Salon {salon_id})'
+    }),
+}
+
+
 def obtenir_permissions_utilisateur(user_data: Dict) -> Dict:
     """
     Détermine les permissions de l'utilisateur selon son rôle
@@ -17,40 +51,14 @@ def obtenir_permissions_utilisateur(user_data: Dict) -> Dict:
     """
     role = user_data.get('role', 'employe')
     salon_id = user_data.get('salon_id')
+    perms = _ROLE_PERMS.get(role, _ROLE_PERMS['employe'])
     
-    if role == 'SUPER_ADMIN':
-        return {
-            'can_view_all_salons': True,
-            'can_create_salon': True,
-            'can_create_admin': True,
-            'can_create_employe': False,  # Le SUPER_ADMIN crée des admins, pas des employés
-            'can_switch_salon': True,
-            'can_manage_all_data': True,
-            'current_salon_filter': None,  # None = voir tout par défaut
-            'role_display': '👑 Super Administrateur'
-        }
-    elif role == 'admin':
-        return {
-            'can_view_all_salons': False,
-            'can_create_salon': False,
-            'can_create_admin': False,
-            'can_create_employe': True,
-            'can_switch_salon': False,
-            'can_manage_all_data': False,
-            'current_salon_filter': salon_id,
-            'role_display': f'🏢 Administrateur (Salon {salon_id})'
-        }
-    else:  # employe
-        return {
-            'can_view_all_salons': False,
-            'can_create_salon': False,
-            'can_create_admin': False,
-            'can_create_employe': False,
-            'can_switch_salon': False,
-            'can_manage_all_data': False,
-            'current_salon_filter': salon_id,
-            'role_display': f'👤 Employé (Salon {salon_id})'
-        }
+    return {
+        **perms,
+        # None = voir tout par défaut (SUPER_ADMIN)
+        'current_salon_filter': None if role == 'SUPER_ADMIN' else salon_id,
+        'role_display': perms['role_display'].format(salon_id=salon_id)
+    }
 
 
 def get_salon_filter() -> Optional[int]:
@@ -68,9 +76,10 @@ def get_salon_filter() -> Optional[int]:
 
 
 def est_super_admin() -> bool:
-    if "user" not in st.session_state or not st.session_state.user:
+    user = st.session_state.get("user")
+    if not user:
         return False
-    role = st.session_state.user.get("role", "")
+    role = user.get("role", "")
     # Normaliser le rôle pour gérer les variations de casse
     role_normalise = str(role).upper().strip()
     return role_normalise == 'SUPER_ADMIN'
@@ -87,8 +96,8 @@ def peut_creer_admin() -> bool:
 
 
 def peut_creer_employe() -> bool:
-    if "user" not in st.session_state or not st.session_state.user:
+    user = st.session_state.get("user")
+    if not user:
         return False
-    role = st.session_state.user.get("role")
-    return role == 'admin'
+    return user.get("role") == 'admin'
 
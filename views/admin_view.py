@@ -77,7 +77,7 @@ def afficher_page_administration():
     # Récupérer les informations du salon
     salon_info = None
     if salon_id_admin:
-        salon_info = salon_model.obtenir_salon_by_id(salon_id_admin)
+        salon_info = salon_model.obtenir_salon_sans_admin(salon_id_admin)
     
     # ========================================================================
     # HEADER DE LA PAGE
@@ -1137,9 +1137,8 @@ def _generer_pdf_table_charges(titre: str, sous_titre: str, df_table: pd.DataFra
         if salon_id and st.session_state.get('db'):
             try:
                 logo_model = AppLogoModel(st.session_state.db)
-                logo_data = logo_model.recuperer_logo(salon_id)
-                if logo_data and logo_data.get('logo_data'):
-                    logo_bytes = logo_data['logo_data']
+                logo_bytes = logo_model.recuperer_logo_bytes(salon_id)
+                if logo_bytes:
                     logo_reader = ImageReader(io.BytesIO(logo_bytes))
                     logo_img = Image(logo_reader, width=3.0 * cm, height=3.0 * cm)
             except Exception as e:
@@ -1150,7 +1149,7 @@ def _generer_pdf_table_charges(titre: str, sous_titre: str, df_table: pd.DataFra
         try:
             if salon_id and st.session_state.get('db'):
                 salon_model = SalonModel(st.session_state.db)
-                salon = salon_model.obtenir_salon_by_id(salon_id)
+                salon = salon_model.obtenir_salon_sans_admin(salon_id)
                 if salon:
                     nom = salon.get('nom_salon') or salon_id
                     quartier = salon.get('quartier') or ''
@@ -1989,7 +1988,9 @@ def afficher_gestion_logo(admin_data: Dict):
     # Afficher le logo actuel s'il existe
     st.markdown("##### 📷 Logo actuel de votre salon")
     
-    logo_data = logo_model.recuperer_logo(salon_id)
+    logo_data = logo_model.recuperer_logo(
+        salon_id, ('logo_data', 'mime_type', 'logo_name', 'file_size', 'uploaded_at')
+    )
     
     if logo_data and logo_data.get('logo_data'):
         # Afficher le logo depuis la BDD
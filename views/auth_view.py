@@ -7,11 +7,19 @@ VUE D'AUTHENTIFICATION (auth_view.py)
 import base64
 import mimetypes
 import os
+import re
+from functools import lru_cache
+from time import monotonic
+
 import streamlit as st
 from controllers.auth_controller import AuthController
-from models.database import DatabaseConnection
-from config import DATABASE_CONFIG, APP_CONFIG, BRANDING
-from utils.bottom_nav import load_site_content
+from controllers.commande_controller import CommandeController
+from models.database import AppLogoModel, ChargesModel, DatabaseConnection
+from config import DATABASE_CONFIG, APP_CONFIG, BRANDING, IS_RENDER
+
+# Configuration de connexion utilisée par la page (Render ou PostgreSQL local)
+_CLE_CONFIG_DB = "render_production" if IS_RENDER else "postgresql_local"
+_LIBELLE_DB = "Render" if IS_RENDER else "PostgreSQL locale"
 
 # ==========================================================
 # 🔒 GARDE-FOU SESSION (ANTI RERUN DB)
@@ -67,7 +75,10 @@ def _get_logo_data_uri():
 # ==========================================================
 # CSS / STYLES (INCHANGÉS)
 # ==========================================================
-lux_vars_style = f"""
+@lru_cache(maxsize=1)
+def _build_static_css():
+    # BRANDING est constant pour le processus : feuille construite une seule fois
+    return f"""
 <style>
 :root {{
 --lux-primary: {BRANDING.get('primary', '#C9A227')};
@@ -78,7 +89,7 @@ lux_vars_style = f"""
 }}
 </style>
 """
-st.markdown(lux_vars_style, unsafe_allow_html=True)
+
 
 # (CSS long inchangé – volontairement non modifié)
 # ⬇️ ⬇️ ⬇️
@@ -87,76 +98,166 @@ st.markdown(lux_vars_style, unsafe_allow_html=True)
 # ==========================================================
 # PAGE DE CONNEXION
 # ==========================================================
-def afficher_page_connexion():
-    content = load_site_content()
+_CONSEIL_BASE_ABSENTE = "La base de données indiquée n'existe pas : créez-la ou corrigez DATABASE_CONFIG."
+_CONSEIL_IDENTIFIANTS = "Identifiants refusés : vérifiez l'utilisateur et le mot de passe."
+_CONSEIL_SERVEUR = "Serveur injoignable : vérifiez que PostgreSQL est démarré, ainsi que l'hôte et le port."
+
+# Diagnostic des erreurs de connexion PostgreSQL (messages libpq anglais ou français) :
+# une seule recherche par expression compilée, puis aiguillage sur le fragment trouvé
+_PG_ERR_RE = re.compile(
+    r"does not exist|n'existe pas|password authentication failed|mot de passe"
+    r"|could not connect|refused",
+    re.IGNORECASE,
+)
+_PG_ERR_CONSEILS = {
+    "does not exist": _CONSEIL_BASE_ABSENTE,
+    "n'existe pas": _CONSEIL_BASE_ABSENTE,
+    "password authentication failed": _CONSEIL_IDENTIFIANTS,
+    "mot de passe": _CONSEIL_IDENTIFIANTS,
+    "could not connect": _CONSEIL_SERVEUR,
+    "refused": _CONSEIL_SERVEUR,
+}
+
+
+def _diagnostic_connexion(error_msg):
+    m = _PG_ERR_RE.search(error_msg)
+    return _PG_ERR_CONSEILS.get(m.group(0).lower()) if m else None
+
+
+def _message_echec(titre, db):
+    # Erreur du pilote conservée par DatabaseConnection.connect() (pas de 2e tentative)
+    if not db._last_error:
+        return titre
+    message = f"{titre} : {db._last_error}"
+    conseil = _diagnostic_connexion(db._last_error)
+    return f"{message}\n\n💡 {conseil}" if conseil else message
+
+
+# Objets créés par les initialiseurs ci-dessous (tables et index, tous visibles par
+# to_regclass) ; à tenir à jour avec CouturierModel/ClientModel/ChargesModel/AppLogoModel.creer_tables
+_OBJETS_SCHEMA = [
+    "couturiers", "clients", "commandes", "charges", "charge_documents", "app_logo",
+    "idx_couturiers_salon", "idx_charges_cout_date", "idx_couturiers_salon_id",
+]
+# Colonnes ajoutées après coup aux tables existantes (ALTER TABLE des initialiseurs)
+_REQUETE_SCHEMA_PRET = """
+    SELECT bool_and(to_regclass(nom) IS NOT NULL)
+           AND EXISTS (SELECT 1 FROM information_schema.columns
+                       WHERE table_name = 'couturiers' AND column_name = 'actif')
+           AND EXISTS (SELECT 1 FROM information_schema.columns
+                       WHERE table_name = 'app_logo' AND column_name = 'compressed')
+    FROM unnest(%s::text[]) AS nom
+"""
 
-    from config import IS_RENDER
 
-    # ======================================================
-    # CONNEXION AUTOMATIQUE DB (1 SEULE FOIS PAR SESSION)
-    # ======================================================
-    if not st.session_state.db_initialized:
+def _schema_pret(db):
+    # Une seule requête de lecture au lieu des lots de DDL quand tout existe déjà
+    try:
+        with db.cursor(lecture_seule=True) as (cursor, conn):
+            cursor.execute(_REQUETE_SCHEMA_PRET, (_OBJETS_SCHEMA,))
+            return bool(cursor.fetchone()[0])
+    except Exception:
+        return False
 
-        if IS_RENDER and st.session_state.db_connection is None:
-            try:
-                config = DATABASE_CONFIG.get("render_production", {})
-                db = DatabaseConnection("postgresql", config)
 
-                if db.connect():
-                    st.session_state.db_connection = db
-                    st.session_state.db_type = "render_production"
+def _initialiser_schema(db):
+    # DDL idempotent (CREATE TABLE IF NOT EXISTS), lancé seulement si la sonde
+    # trouve un objet manquant ; appelé une fois par connexion partagée
+    if not _schema_pret(db):
+        AuthController(db).initialiser_tables()
+        CommandeController(db).initialiser_tables()
+        ChargesModel(db).creer_tables()
+        AppLogoModel(db).creer_tables()
 
-                    auth_controller = AuthController(db)
-                    auth_controller.initialiser_tables()
 
-                    from controllers.commande_controller import CommandeController
-                    CommandeController(db).initialiser_tables()
+def _db_valide(db):
+    # Contrôle de santé du pool à chaque récupération depuis le cache : s'il ne
+    # répond plus (redémarrage du serveur), un nouveau pool est créé. L'ancien
+    # n'est pas fermé ici : des sessions y sont encore rattachées
+    try:
+        with db.cursor(lecture_seule=True) as (cursor, conn):
+            cursor.execute("SELECT 1")
+        return True
+    except Exception:
+        return False
 
-                    from models.database import ChargesModel
-                    ChargesModel(db).creer_tables()
 
-                    st.session_state.db_initialized = True
-                    st.success("✅ Connexion Render réussie")
-                    st.rerun()
-                else:
-                    st.error("❌ Connexion Render échouée")
-                    st.stop()
-            except Exception as e:
-                st.error(f"❌ Erreur Render : {e}")
-                st.stop()
+@st.cache_resource(show_spinner=False, validate=_db_valide)
+def _obtenir_db_partagee():
+    """
+    Pool PostgreSQL partagé par toutes les sessions du processus, schéma
+    initialisé à la création. Chaque session s'y rattache avec sa propre
+    instance (partager_pool), jamais avec celle-ci. Une exception n'est pas
+    mise en cache : l'échec est retenté au prochain appel.
+    """
+    config = DATABASE_CONFIG.get(_CLE_CONFIG_DB, {})
+    db = DatabaseConnection("postgresql", config)
+    if not db.connect():
+        raise ConnectionError(_message_echec(f"❌ Connexion {_LIBELLE_DB} échouée", db))
+    _initialiser_schema(db)
+    return db
 
-        if not IS_RENDER and st.session_state.db_connection is None:
-            try:
-                config = DATABASE_CONFIG.get("postgresql_local", {})
-                db = DatabaseConnection("postgresql", config)
 
-                if db.connect():
-                    st.session_state.db_connection = db
-                    st.session_state.db_type = "postgresql_local"
+# Délai (secondes) pendant lequel un échec de connexion est réaffiché sans retenter
+_DELAI_NOUVEL_ESSAI = 15
 
-                    auth_controller = AuthController(db)
-                    auth_controller.initialiser_tables()
 
-                    from controllers.commande_controller import CommandeController
-                    CommandeController(db).initialiser_tables()
+def _afficher_echec_connexion(message):
+    st.error(message)
+    if st.button("🔄 Réessayer", key="db_reessayer"):
+        st.session_state.db_initialized = False
+        st.rerun()
+    st.stop()
 
-                    from models.database import ChargesModel
-                    ChargesModel(db).creer_tables()
 
-                    st.session_state.db_initialized = True
-                    st.success("✅ Connexion PostgreSQL locale réussie")
-                    st.rerun()
-                else:
-                    st.error("❌ Connexion PostgreSQL locale échouée")
-                    st.stop()
-            except Exception as e:
-                st.error(f"❌ Erreur locale : {e}")
-                st.stop()
+def _memoriser_echec_connexion(message):
+    # Tentative terminée (échec) : les reruns des _DELAI_NOUVEL_ESSAI secondes
+    # suivantes réaffichent le message au lieu de rouvrir une connexion à chaque
+    # interaction ; le bouton « Réessayer » relance immédiatement
+    st.session_state.db_initialized = True
+    st.session_state.db_last_error = message
+    st.session_state.db_echec_ts = monotonic()
+    _afficher_echec_connexion(message)
+
+
+def afficher_page_connexion():
+    # Échec récent dans cette session : réafficher l'erreur sans retenter
+    if st.session_state.db_initialized and st.session_state.db_connection is None:
+        echec_ts = st.session_state.get("db_echec_ts")
+        if echec_ts is not None and monotonic() - echec_ts < _DELAI_NOUVEL_ESSAI:
+            _afficher_echec_connexion(
+                st.session_state.get("db_last_error") or "❌ Connexion base de données indisponible"
+            )
+        st.session_state.db_initialized = False
+
+    # Connexion de la session coupée (redémarrage du serveur) : la rendre et se rattacher à nouveau
+    db_session = st.session_state.db_connection
+    if db_session is not None and not db_session.is_connected():
+        db_session.disconnect()
+        st.session_state.db_connection = None
+        st.session_state.db_initialized = False
+
+    # ======================================================
+    # CONNEXION AUTOMATIQUE DB (1 SEULE FOIS PAR SESSION)
+    # ======================================================
+    if not st.session_state.db_initialized:
+        try:
+            # Connexion propre à la session, sur le pool partagé
+            db = _obtenir_db_partagee().partager_pool()
+        except ConnectionError as e:
+            _memoriser_echec_connexion(str(e))
+        except Exception as e:
+            _memoriser_echec_connexion(f"❌ Erreur {_LIBELLE_DB} : {e}")
+
+        st.session_state.db_connection = db
+        st.session_state.db_type = _CLE_CONFIG_DB
+        st.session_state.db_initialized = True
 
     # ======================================================
     # FORMULAIRE DE CONNEXION
     # ======================================================
-    st.markdown('<div class="login-scope">', unsafe_allow_html=True)
+    # Styles globaux et ouverture du conteneur : un seul message markdown par rerun
+    st.markdown(_build_static_css() + '<div class="login-scope">', unsafe_allow_html=True)
 
     _, col, _ = st.columns([1, 1.3, 1])
 
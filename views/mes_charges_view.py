@@ -1245,11 +1245,11 @@ def _get_logo_from_db(salon_id: Optional[str] = None) -> Optional[bytes]:
         if salon_id and st.session_state.get('db'):
             from models.database import AppLogoModel
             logo_model = AppLogoModel(st.session_state.db)
-            logo_data = logo_model.recuperer_logo(salon_id)
+            logo_bytes = logo_model.recuperer_logo_bytes(salon_id)
             
-            if logo_data and logo_data.get('logo_data'):
+            if logo_bytes:
                 print(f"✅ Logo récupéré depuis la BDD (Salon ID: {salon_id})")
-                return logo_data['logo_data']
+                return logo_bytes
     except Exception as e:
         print(f"Erreur récupération logo depuis BDD: {e}")
     
@@ -1296,7 +1296,7 @@ def _generer_pdf_impots(date_debut,
             if salon_id and st.session_state.get('db'):
                 from models.salon_model import SalonModel
                 salon_model = SalonModel(st.session_state.db)
-                salon = salon_model.obtenir_salon_by_id(salon_id)
+                salon = salon_model.obtenir_salon_sans_admin(salon_id)
                 if salon:
                     nom = salon.get('nom_salon') or salon_id
                     quartier = salon.get('quartier') or ''
@@ -1566,7 +1566,7 @@ def _generer_pdf_analyse_charges(date_debut,
             if salon_id and st.session_state.get('db'):
                 from models.salon_model import SalonModel
                 salon_model = SalonModel(st.session_state.db)
-                salon = salon_model.obtenir_salon_by_id(salon_id)
+                salon = salon_model.obtenir_salon_sans_admin(salon_id)
                 if salon:
                     nom = salon.get('nom_salon') or salon_id
                     quartier = salon.get('quartier') or ''
@@ -1927,7 +1927,7 @@ def _generer_pdf_bulletin_salaire(employe_nom: str,
             if salon_id and st.session_state.get('db'):
                 from models.salon_model import SalonModel
                 salon_model = SalonModel(st.session_state.db)
-                salon = salon_model.obtenir_salon_by_id(salon_id)
+                salon = salon_model.obtenir_salon_sans_admin(salon_id)
                 if salon:
                     nom = salon.get('nom_salon') or salon_id
                     quartier = salon.get('quartier') or ''
@@ -765,15 +765,19 @@ def afficher_gestion_salons(salon_model):
                             statut_actif == salon.get('actif', True)):
                             st.info("ℹ️ Aucune modification détectée")
                         else:
-                            # Appeler la méthode de modification
+                            # Appeler la méthode de modification avec les seuls champs modifiés
+                            nouvelles_valeurs = {
+                                'nom': (nouveau_nom, salon.get('nom_salon')),
+                                'quartier': (nouveau_quartier, salon.get('quartier')),
+                                'responsable': (nouveau_responsable, salon.get('responsable')),
+                                'telephone': (nouveau_telephone, salon.get('telephone')),
+                                'email': (nouveau_email, salon.get('email')),
+                                'actif': (statut_actif, salon.get('actif', True)),
+                            }
                             success = salon_model.modifier_salon(
                                 salon_id=salon['salon_id'],
-                                nom=nouveau_nom if nouveau_nom != salon.get('nom_salon') else None,
-                                quartier=nouveau_quartier if nouveau_quartier != salon.get('quartier') else None,
-                                responsable=nouveau_responsable if nouveau_responsable != salon.get('responsable') else None,
-                                telephone=nouveau_telephone if nouveau_telephone != salon.get('telephone') else None,
-                                email=nouveau_email if nouveau_email != salon.get('email') else None,
-                                actif=statut_actif if statut_actif != salon.get('actif', True) else None
+                                **{champ: nouveau for champ, (nouveau, actuel) in nouvelles_valeurs.items()
+                                   if nouveau != actuel}
                             )
                             
                             if success: